@@ -1,6 +1,29 @@
 import re
 from core.models import SignalType
 
+# Pre-compiled patterns (avoid re-parsing / cache lookups on every parse call)
+_VHDL_COMMENT_RE = re.compile(r"--.*")
+# We look for 'port (' and then walk the parentheses to the one closing the block
+# (vector ranges like '(7 downto 0)' nest inside, so a non-greedy ');' would stop early)
+_VHDL_PORT_OPEN_RE = re.compile(r"\bport\s*\(", re.IGNORECASE)
+_PAREN_RE = re.compile(r"[()]")
+# One port declaration per match: name(s) : direction type [rest up to next ';']
+# Each match must start at the block start or right after a ';' (same as splitting by ';')
+_VHDL_PORT_DECL_RE = re.compile(r"(?:^|;)\s*([\w,][\w\s,]*)\s*:\s*(in|out|inout)(?=\s+[^\s;])\s+([\w\s\(\) downto]+)[^;]*", re.IGNORECASE)
+_WIDTH_RE = re.compile(r"(\d+)\s+downto\s+(\d+)")
+# Regex for Verilog ports: (input|output|inout) [bits:bits] name
+# Handles: input clk, output [7:0] q, input wire [15:0] d
+_VERILOG_PORT_RE = re.compile(r"(input|output|inout)\s+(?:wire|reg\s+)?(?:\[(\d+)\s*:\s*(\d+)\]\s*)?(\w+)", re.IGNORECASE)
+# Case-insensitive keyword probes for the parsers' early exits (no lowercased copy of the text)
+_VHDL_PORT_WORD_RE = re.compile(r"port", re.IGNORECASE)
+_VERILOG_DIR_WORD_RE = re.compile(r"input|output|inout", re.IGNORECASE)
+
+# Small memo of recent parse results (re-importing the same HDL text is common).
+# Keyed by the full text; entries are stored as tuples of item tuples and rebuilt
+# into fresh dicts on every hit so callers may freely mutate what they get back.
+_PARSE_CACHE = {}
+_PARSE_CACHE_SIZE = 8
+
 class HDLParser:
     @staticmethod
     def parse(text: str):
@@ -8,75 +31,110 @@ class HDLParser:
         Main entry point to parse HDL text.
         Detects if it's VHDL or Verilog and calls appropriate parser.
         """
-        if "entity" in text.lower() and "port" in text.lower():
+        cached = _PARSE_CACHE.get(text)
+        if cached is not None:
+            return [dict(items) for items in cached]
+
+        signals = HDLParser._parse_uncached(text)
+
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+        _PARSE_CACHE[text] = tuple(tuple(sig.items()) for sig in signals)
+        return signals
+
+    @staticmethod
+    def _parse_uncached(text: str):
+        # Sniff the head first: a VHDL entity with its port clause is almost always near the top.
+        # Anything else (incl. a 'module' that may just be a word in a comment) is decided on
+        # the whole text, keeping VHDL ahead of Verilog.
+        low = text[:4096].lower()
+        if "entity" in low and "port" in low:
             return HDLParser.parse_vhdl(text)
-        elif "module" in text.lower():
+        if len(text) > 4096:
+            low = text.lower()
+
+        if "entity" in low and "port" in low:
+            return HDLParser.parse_vhdl(text)
+        elif "module" in low:
             return HDLParser.parse_verilog(text)
         return []
 
     @staticmethod
     def parse_vhdl(text: str):
+        # Fixed-string existence test before any regex work (e.g. package bodies have no port)
+        if not _VHDL_PORT_WORD_RE.search(text):
+            return []
+
         # 1. Strip comments (VHDL uses --)
-        text = re.sub(r"--.*", "", text)
+        # Fixed-string check first: comment-free sources skip the regex pass entirely
+        if "--" in text:
+            text = _VHDL_COMMENT_RE.sub("", text)
         
         # 2. Find Port block content
-        # We look for 'port (' and match until the last ');' in the text
-        # This is more robust than non-greedy match which stops at vector closing parens ');'
-        port_match = re.search(r"port\s*\((.*)\)\s*;", text, re.IGNORECASE | re.DOTALL)
-        if not port_match:
+        content = HDLParser._find_port_block(text)
+        if content is None:
             return []
         
-        content = port_match.group(1).strip()
+        content = content.strip()
         
         signals = []
-        # Split by semicolon (each port line)
-        lines = content.split(';')
-        for line in lines:
-            line = line.strip()
-            if not line: continue
+        # Scan port declarations in a single pass (no per-line split/strip)
+        # Handles multiple names: i_clk, i_rst : in std_logic
+        for m in _VHDL_PORT_DECL_RE.finditer(content):
+            names_raw = m.group(1)
+            direction = m.group(2).lower()
+            type_str = m.group(3).lower()
+            
+            bits = 1
+            # Check for vector width
+            width_m = _WIDTH_RE.search(type_str)
+            if width_m:
+                high = int(width_m.group(1))
+                low = int(width_m.group(2))
+                bits = abs(high - low) + 1
             
-            # Pattern: name(s) : direction type
-            # Handles multiple names: i_clk, i_rst : in std_logic
-            m = re.match(r"([\w\s,]+)\s*:\s*(in|out|inout)\s+([\w\s\(\) downto]+)", line, re.IGNORECASE)
-            if m:
-                names_raw = m.group(1)
-                direction = m.group(2).lower()
-                type_str = m.group(3).lower()
-                
-                bits = 1
-                # Check for vector width
-                width_m = re.search(r"(\d+)\s+downto\s+(\d+)", type_str)
-                if width_m:
-                    high = int(width_m.group(1))
-                    low = int(width_m.group(2))
-                    bits = abs(high - low) + 1
-                
-                # Split names if comma separated
-                names = [n.strip() for n in names_raw.split(',')]
-                for name in names:
-                    if not name: continue
-                    sig_type = HDLParser.guess_type(name, direction, bits, type_str)
-                    signals.append({
-                        'name': name,
-                        'type': sig_type,
-                        'bits': bits,
-                        'direction': direction
-                    })
+            # Split names if comma separated
+            names = [n.strip() for n in names_raw.split(',')]
+            for name in names:
+                if not name: continue
+                sig_type = HDLParser.guess_type(name, direction, bits, type_str)
+                signals.append({
+                    'name': name,
+                    'type': sig_type,
+                    'bits': bits,
+                    'direction': direction
+                })
         return signals
 
+    @staticmethod
+    def _find_port_block(text: str):
+        """Returns the text between 'port (' and its matching ')', or None if unbalanced."""
+        open_m = _VHDL_PORT_OPEN_RE.search(text)
+        if not open_m:
+            return None
+        start = open_m.end()
+        depth = 1
+        # Jump from paren to paren instead of running a greedy DOTALL match over the body
+        for m in _PAREN_RE.finditer(text, start):
+            if m.group() == "(":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return text[start:m.start()]
+        return None
+
     @staticmethod
     def parse_verilog(text: str):
+        if not _VERILOG_DIR_WORD_RE.search(text):
+            return []
+
         signals = []
         # Support both old style (module M(a,b); input a; ...) and ANSI style (module M(input a, ...))
         # Simple approach: look for 'input/output/inout' keywords
-        lines = text.split('\n')
-        combined_text = " ".join(lines)
-        
-        # Regex for Verilog ports: (input|output|inout) [bits:bits] name
-        # Handles: input clk, output [7:0] q, input wire [15:0] d
-        pattern = re.compile(r"(input|output|inout)\s+(?:wire|reg\s+)?(?:\[(\d+)\s*:\s*(\d+)\]\s*)?(\w+)", re.IGNORECASE)
-        
-        for m in pattern.finditer(combined_text):
+        # The port regex only relies on \s between tokens, so it runs on the raw text (newlines included)
+        for m in _VERILOG_PORT_RE.finditer(text):
             direction = m.group(1).lower()
             high_str = m.group(2)
             low_str = m.group(3)
@@ -99,10 +157,11 @@ class HDLParser:
     @staticmethod
     def guess_type(name, direction, bits, raw_type_str):
         name_lower = name.lower()
+        type_lower = raw_type_str.lower()
         if "clk" in name_lower or "clock" in name_lower:
             return SignalType.CLK
         
-        if bits > 1 or "vector" in raw_type_str.lower():
+        if bits > 1 or "vector" in type_lower:
             # Usually data bus if it has name indicators like 'q', 'd', 'data', 'addr'
             # Or state if it has 'state'
             if "state" in name_lower:
@@ -115,3 +174,9 @@ class HDLParser:
             return SignalType.OUTPUT
         else:
             return SignalType.INOUT
+
+# Touch every pattern once at import so the first import dialog parse doesn't pay any lazy setup
+for _p in (_VHDL_COMMENT_RE, _VHDL_PORT_OPEN_RE, _PAREN_RE, _VHDL_PORT_DECL_RE, _WIDTH_RE, _VERILOG_PORT_RE,
+           _VHDL_PORT_WORD_RE, _VERILOG_DIR_WORD_RE):
+    _p.search("")
+del _p
@@ -1,4 +1,7 @@
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from itertools import groupby
 from enum import Enum
 from typing import List, Dict, Any
 import PyQt6.QtGui as QtGui
@@ -11,7 +14,30 @@ class SignalType(Enum):
     BUS_DATA = "Bus[data]"
     BUS_STATE = "Bus[state]"
 
-@dataclass
+# Name -> SignalType lookup (hoisted, used when restoring signals from dicts)
+# Plain dict with interned keys instead of probing the __members__ mappingproxy each time
+_SIGNAL_TYPES = {sys.intern(k): v for k, v in SignalType.__members__.items()}
+
+def value_window(values: List[str], first: int, last: int) -> List[str]:
+    """Returns values[first..last] (inclusive), with cycles past the end read as 'X'."""
+    window = values[first:last + 1]
+    missing = (last - first + 1) - len(window)
+    if missing > 0:
+        window.extend(['X'] * missing)
+    return window
+
+def value_runs(values: List[str], first: int, last: int):
+    """Groups cycles first..last into (start, end, value) runs of identical values.
+       Uses itertools.groupby so the comparison loop runs in C, not per-cycle Python calls."""
+    runs = []
+    start = first
+    for val, grp in groupby(value_window(values, first, last)):
+        end = start + len(list(grp)) - 1
+        runs.append((start, end, val))
+        start = end + 1
+    return runs
+
+@dataclass(slots=True)
 class Signal:
     name: str = "New Signal"
     type: SignalType = SignalType.INPUT
@@ -33,38 +59,88 @@ class Signal:
     input_base: int = 10  # 2, 10, 16 (Default to Decimal)
     display_base: int = 10 # 2, 10, 16 (Default to Decimal)
     
+    # Cached display format, rebuilt only when bits/input_base/display_base change
+    _fmt_key: tuple = field(default=None, init=False, repr=False, compare=False)
+    _fmt_cache: tuple = field(default=None, init=False, repr=False, compare=False)
+    # Formatted text per raw value for the current format (reset with _fmt_key)
+    _text_cache: dict = field(default=None, init=False, repr=False, compare=False)
+    # Runs of identical values, valid while values == _runs_src (values is also mutated in place elsewhere)
+    _runs_src: list = field(default=None, init=False, repr=False, compare=False)
+    _runs: list = field(default=None, init=False, repr=False, compare=False)
+    _run_starts: list = field(default=None, init=False, repr=False, compare=False)
+
+    def get_runs(self):
+        """(start, end, value) runs of identical values in self.values (cached until values change)."""
+        if self._runs_src != self.values: # C-level list compare, no per-cycle Python loop
+            self._runs_src = list(self.values)
+            self._runs = value_runs(self.values, 0, len(self.values) - 1)
+            self._run_starts = [start for start, _, _ in self._runs]
+        return self._runs
+
+    def get_run_starts(self) -> List[int]:
+        """Sorted start cycles of each run in get_runs() (for bisect)."""
+        self.get_runs()
+        return self._run_starts
+
+    def get_run_bounds(self, cycle_index: int):
+        """(start, end) of the run of identical values containing cycle_index (< len(values)).
+           Binary search over the cached run starts instead of scanning cycle by cycle."""
+        starts = self.get_run_starts()
+        i = bisect_right(starts, cycle_index) - 1
+        end = starts[i + 1] - 1 if i + 1 < len(starts) else len(self.values) - 1
+        return starts[i], end
+
+    def _get_bus_format(self):
+        """Returns (mask, format_spec, prefix) for the current bits/display_base."""
+        key = (self.bits, self.display_base, self.input_base)
+        if self._fmt_key != key:
+            bits, base, _ = key
+            mask = (1 << bits) - 1
+            if base == 2:
+                # Binary with padding
+                fmt = (mask, f"0{bits}b", "")
+            elif base == 10:
+                fmt = (mask, "d", "")
+            elif base == 16:
+                # Hex with padding matching bits (4 bits = 1 hex digit)
+                fmt = (mask, f"0{(bits + 3) // 4}X", "0x")
+            elif base == 8:
+                # Octal with padding (3 bits = 1 octal digit)
+                fmt = (mask, f"0{(bits + 2) // 3}o", "0o")
+            else:
+                fmt = (mask, None, "")
+            self._fmt_cache = fmt
+            self._fmt_key = key
+            self._text_cache = {}
+        return self._fmt_cache
+
     def format_bus_value(self, val: str) -> str:
         if self.type != SignalType.BUS_DATA or val in ['X', 'Z', '']:
             return val
         
+        # The renderer formats the same few values over and over: parse/format each once
+        self._get_bus_format()
+        cache = self._text_cache
+        if val in cache:
+            return cache[val]
+        if len(cache) >= 1024:
+            cache.clear()
+        text = cache[val] = self._format_bus_value(val)
+        return text
+
+    def _format_bus_value(self, val: str) -> str:
         try:
             # 1. Parse from input_base
             # Strip common prefixes
             clean_val = val.lower().replace('0x', '').replace('0b', '')
             num = int(clean_val, self.input_base)
             
-            # 2. Mask to bit-width
-            mask = (1 << self.bits) - 1
-            num = num & mask
-            
-            # 3. Format to display_base
-            if self.display_base == 2:
-                # Binary with padding
-                fmt = f"{{:0{self.bits}b}}"
-                return fmt.format(num)
-            elif self.display_base == 10:
-                return str(num)
-            elif self.display_base == 16:
-                # Hex with padding matching bits (4 bits = 1 hex digit)
-                hex_len = (self.bits + 3) // 4
-                fmt = f"{{:0{hex_len}X}}"
-                return "0x" + fmt.format(num)
-            elif self.display_base == 8:
-                # Octal with padding (3 bits = 1 octal digit)
-                oct_len = (self.bits + 2) // 3
-                fmt = f"{{:0{oct_len}o}}"
-                return "0o" + fmt.format(num)
-        except:
+            # 2. Mask to bit-width, 3. Format to display_base
+            mask, spec, prefix = self._get_bus_format()
+            if spec is None:
+                return None
+            return prefix + format(num & mask, spec)
+        except ValueError:
             return val # Fallback for non-numeric or invalid input
             
     def set_value_at(self, cycle_index: int, value: str):
@@ -73,6 +149,15 @@ class Signal:
             self.values.extend(['X'] * (cycle_index - len(self.values) + 1))
         self.values[cycle_index] = value
 
+    def set_range(self, start: int, end: int, value: str):
+        """Sets cycles [start, end] (inclusive) to value with one slice assignment."""
+        if end < start:
+            return
+        # Extend list if needed
+        if end >= len(self.values):
+            self.values.extend(['X'] * (end - len(self.values) + 1))
+        self.values[start:end + 1] = [value] * (end - start + 1)
+
     def get_value_at(self, cycle_index: int) -> str:
         if 0 <= cycle_index < len(self.values):
             return self.values[cycle_index]
@@ -83,8 +168,8 @@ class Signal:
             'name': self.name,
             'type': self.type.name, # Store Enum name
             'color': self.color,
-            'values': self.values,
-            'value_colors': self.value_colors,
+            'values': list(self.values), # Fresh copies so the dict is a standalone snapshot
+            'value_colors': dict(self.value_colors),
             'clk_rising_edge': self.clk_rising_edge,
             'clk_mod': self.clk_mod,
             'pinned': self.pinned,
@@ -96,29 +181,32 @@ class Signal:
 
     @classmethod
     def from_dict(cls, data):
-        s = cls(name=data.get('name', 'New Signal'))
-        type_name = data.get('type', 'INPUT')
+        g = data.get # Bound once; called for every field below
+        s = cls(name=g('name', 'New Signal'))
+        type_name = g('type', 'INPUT')
         
         # Migration: Map old BUS to BUS_DATA
         if type_name == "BUS":
             type_name = "BUS_DATA"
             
-        if type_name in SignalType.__members__:
-            s.type = SignalType[type_name]
+        # Single probe; unknown names keep the INPUT default
+        s.type = _SIGNAL_TYPES.get(type_name, SignalType.INPUT)
             
-        s.color = data.get('color', '#00d2ff')
-        s.values = data.get('values', [])
-        s.value_colors = data.get('value_colors', {})
-        s.clk_rising_edge = data.get('clk_rising_edge', True)
-        s.clk_mod = data.get('clk_mod', 1)
-        s.pinned = data.get('pinned', False)
-        s.sticky = data.get('sticky', False)
-        s.bits = data.get('bits', 8)
-        s.input_base = data.get('input_base', 16)
-        s.display_base = data.get('display_base', 16)
+        s.color = g('color', '#00d2ff')
+        # Interned: repeated values share one object, so value compares (run grouping,
+        # cache checks, paint) take the identity fast path instead of comparing characters
+        s.values = [sys.intern(v) if type(v) is str else v for v in g('values', [])]
+        s.value_colors = g('value_colors', {})
+        s.clk_rising_edge = g('clk_rising_edge', True)
+        s.clk_mod = g('clk_mod', 1)
+        s.pinned = g('pinned', False)
+        s.sticky = g('sticky', False)
+        s.bits = g('bits', 8)
+        s.input_base = g('input_base', 16)
+        s.display_base = g('display_base', 16)
         return s
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     name: str = "Untitled"
     total_cycles: int = 20
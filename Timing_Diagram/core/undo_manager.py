@@ -1,4 +1,3 @@
-import copy
 from core.models import Project, Signal
 
 class UndoManager:
@@ -8,19 +7,42 @@ class UndoManager:
         self.redo_stack = []
         self.pending_snapshot = None # For Lazy/Grouped Undo
         
+    # Note: Project.to_dict() already builds fresh lists/dicts (values are immutable str),
+    # so snapshots are taken directly without a generic deepcopy walk.
+
     def push_snapshot(self):
         """Captures the CURRENT project state IMMEDIATELY."""
         self.pending_snapshot = None # Clear any pending
-        state = copy.deepcopy(self.project.to_dict())
+        state = self.project.to_dict()
         self.undo_stack.append(state)
         # Clearing redo stack on new branch of history
         self.redo_stack.clear()
 
+    # --- Diff Records (single-cell toggles) ---
+    # Stored as tuples: (sig_idx, cycle, old, new)
+    # Records address signals by index. That stays valid because every change to the signal
+    # order (add/remove/reorder) pushes a full snapshot first: undoing down to a record always
+    # restores the order it was recorded with.
+
+    def push_value_change(self, sig_idx, cycle, old, new):
+        """Records a single cycle value change instead of a full project copy."""
+        self.undo_stack.append((sig_idx, cycle, old, new))
+        self.redo_stack.clear()
+        # Keep a pending editor snapshot alive (its edit is committed later), but re-take it
+        # so it describes the state after this record, not before it
+        if self.pending_snapshot is not None:
+            self.pending_snapshot = self.project.to_dict()
+
+    def _apply_record(self, record, use_old):
+        sig_idx, cycle, old, new = record
+        if 0 <= sig_idx < len(self.project.signals):
+            self.project.signals[sig_idx].set_value_at(cycle, old if use_old else new)
+
     def request_snapshot(self):
         """Captures the current state as Pending, but does not push yet.
            Used before potential edits (FocusIn, DragStart)."""
         if self.pending_snapshot is None:
-            self.pending_snapshot = copy.deepcopy(self.project.to_dict())
+            self.pending_snapshot = self.project.to_dict()
             
     def commit_snapshot(self):
         """Determines if a pending snapshot should be committed.
@@ -41,8 +63,15 @@ class UndoManager:
         self.pending_snapshot = None # Discard pending on undo
         if not self.can_undo(): return False
         
+        # Diff record: apply the inverse and move the record itself to Redo
+        if isinstance(self.undo_stack[-1], tuple):
+            record = self.undo_stack.pop()
+            self._apply_record(record, use_old=True)
+            self.redo_stack.append(record)
+            return True
+        
         # 1. Push current state to Redo
-        current_state = copy.deepcopy(self.project.to_dict())
+        current_state = self.project.to_dict()
         self.redo_stack.append(current_state)
         
         # 2. Pop previous state
@@ -56,8 +85,15 @@ class UndoManager:
         self.pending_snapshot = None # Discard pending on redo
         if not self.can_redo(): return False
         
+        # Diff record: re-apply it and move it back to Undo
+        if isinstance(self.redo_stack[-1], tuple):
+            record = self.redo_stack.pop()
+            self._apply_record(record, use_old=False)
+            self.undo_stack.append(record)
+            return True
+        
         # 1. Push current state to Undo
-        current_state = copy.deepcopy(self.project.to_dict())
+        current_state = self.project.to_dict()
         self.undo_stack.append(current_state)
         
         # 2. Pop next state
@@ -1,7 +1,7 @@
 import sys
 import os
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QFile, QTextStream, Qt
+from PyQt6.QtCore import QFile, Qt
 
 from ui.mainwindow import MainWindow
 
@@ -30,8 +30,8 @@ def main():
     style_file = QFile(style_path)
     
     if style_file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
-        stream = QTextStream(style_file)
-        app.setStyleSheet(stream.readAll())
+        # Decode the raw bytes directly (skips QTextStream's codec detection and extra copy)
+        app.setStyleSheet(str(style_file.readAll(), 'utf-8'))
     else:
         print(f"Warning: Could not load stylesheet from {style_path}")
     
@@ -0,0 +1,31 @@
+import sys
+import unittest
+
+# Add project root to path
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.hdl_parser import HDLParser
+from core.models import SignalType
+
+class TestHDLParser(unittest.TestCase):
+    def ports(self, text):
+        return [(s['name'], s['type']) for s in HDLParser.parse(text)]
+
+    def test_vhdl_entity(self):
+        text = "entity top is\n  port (\n    clk : in std_logic;\n    q : out std_logic_vector(7 downto 0)\n  );\nend top;\n"
+        self.assertEqual(self.ports(text), [('clk', SignalType.CLK), ('q', SignalType.BUS_DATA)])
+
+    def test_verilog_module(self):
+        text = "module top(input clk, output [3:0] q);\nendmodule\n"
+        self.assertEqual(self.ports(text), [('clk', SignalType.CLK), ('q', SignalType.BUS_DATA)])
+
+    def test_vhdl_entity_after_head_with_module_word(self):
+        """A 'module' in a leading comment must not send a VHDL file past 4 KB to the Verilog parser"""
+        text = ("-- This module is documented below\n" + "-- padding\n" * 500 +
+                "entity top is\n  port (\n    a : in std_logic;\n    b : out std_logic\n  );\nend top;\n")
+        self.assertGreater(text.index("entity"), 4096)
+        self.assertEqual(self.ports(text), [('a', SignalType.INPUT), ('b', SignalType.OUTPUT)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import sys
+import unittest
+
+# Add project root to path
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.models import Signal, SignalType
+
+class TestBusFormat(unittest.TestCase):
+    def fmt(self, val, input_base, display_base, bits=8):
+        signal = Signal(type=SignalType.BUS_DATA, bits=bits, input_base=input_base, display_base=display_base)
+        return signal.format_bus_value(val)
+
+    def test_prefixed_input(self):
+        self.assertEqual(self.fmt("0x1F", 16, 10), "31")
+        self.assertEqual(self.fmt("0b101", 2, 16), "0x05")
+        # int() accepts the base's own prefix, e.g. octal '0o'
+        self.assertEqual(self.fmt("0o17", 8, 16), "0x0F")
+
+    def test_signed_hex_input(self):
+        """'-0x1f' is parsed as -31 and masked to the bit width"""
+        self.assertEqual(self.fmt("-0x1f", 16, 10), "225")
+        self.assertEqual(self.fmt("-0x1f", 16, 16), "0xE1")
+
+    def test_non_numeric_passthrough(self):
+        self.assertEqual(self.fmt("IDLE", 16, 10), "IDLE")
+        self.assertEqual(self.fmt("0x", 16, 10), "0x")
+        self.assertEqual(self.fmt("X", 16, 10), "X")
+
+if __name__ == '__main__':
+    unittest.main()
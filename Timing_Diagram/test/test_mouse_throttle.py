@@ -0,0 +1,70 @@
+import sys
+import unittest
+
+# Add project root to path
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen") # No window needed
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import Qt, QPoint, QPointF, QEvent
+from PyQt6.QtGui import QMouseEvent
+from PyQt6.QtWidgets import QApplication
+from core.models import Project, Signal, SignalType
+from ui.canvas import WaveformCanvas
+
+# One QApplication for the whole process (reused if another test module already made one)
+_APP = QApplication.instance() or QApplication([])
+
+class TestMouseThrottle(unittest.TestCase):
+    def setUp(self):
+        self.project = Project(total_cycles=20, cycle_width=20)
+        # Two bus blocks: A on [0, 2], B on [3, 5]
+        self.signal = Signal(name="Bus", type=SignalType.BUS_DATA, values=['A'] * 3 + ['B'] * 3)
+        self.project.add_signal(self.signal)
+        self.canvas = WaveformCanvas(self.project)
+        self.canvas.resize(800, 600)
+
+    def pos_at_cycle(self, cycle_idx):
+        c = self.canvas
+        return QPointF(QPoint(c.signal_header_width + cycle_idx * self.project.cycle_width + self.project.cycle_width // 2,
+                              c.header_height + c.row_height // 2))
+
+    def move(self, cycle_idx):
+        """Hover move (no buttons) through the public, throttled handler"""
+        event = QMouseEvent(QEvent.Type.MouseMove, self.pos_at_cycle(cycle_idx), Qt.MouseButton.NoButton, Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier)
+        self.canvas.mouseMoveEvent(event)
+
+    def press(self, cycle_idx):
+        event = QMouseEvent(QEvent.Type.MouseButtonPress, self.pos_at_cycle(cycle_idx), Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+        self.canvas.mousePressEvent(event)
+
+    def test_moves_coalesce_to_latest(self):
+        """Moves inside the throttle window are dropped except the latest, applied when the window ends"""
+        hovers = []
+        update_guide = self.canvas.update_guide
+        def record(*h):
+            hovers.append(self.canvas.hover_pos)
+            update_guide(*h)
+        self.canvas.update_guide = record
+        
+        self.move(1) # Applied immediately
+        for cycle_idx in (2, 3, 4):
+            self.move(cycle_idx) # Deferred, each replacing the previous one
+        self.assertEqual(self.canvas.hover_pos, (0, 1))
+        
+        self.canvas._move_timer.timeout.emit() # End the throttle window (no wall-clock wait)
+        self.assertEqual(self.canvas.hover_pos, (0, 4))
+        self.assertEqual(hovers, [(0, 1), (0, 4)])
+
+    def test_press_applies_pending_move(self):
+        """A press inside the throttle window acts on the pressed cell, not the last applied hover"""
+        self.move(1) # Applied immediately, opens the throttle window
+        self.move(4) # Deferred
+        self.assertEqual(self.canvas.hover_pos, (0, 1))
+        
+        self.press(4)
+        self.assertEqual(self.canvas.hover_pos, (0, 4))
+        self.assertEqual(self.canvas.selected_regions, [(0, 3, 5)])
+
+if __name__ == '__main__':
+    unittest.main()
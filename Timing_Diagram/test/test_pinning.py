@@ -0,0 +1,65 @@
+import sys
+import unittest
+
+# Add project root to path
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen") # No window/event loop needed
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+from ui.mainwindow import MainWindow
+from core.models import Signal, SignalType
+
+# One QApplication for the whole process (reused if another test module already made one)
+_APP = QApplication.instance() or QApplication([])
+
+class TestPinning(unittest.TestCase):
+    def setUp(self):
+        self.window = MainWindow()
+        self.first_new = len(self.window.project.signals)
+        
+        # 增加大量信號以測試捲動
+        for i in range(50):
+            sig = Signal(name=f"Sig_{i}", type=SignalType.INPUT)
+            if i % 10 == 0:
+                sig.pinned = True # 應該儲存/預設出現
+                sig.color = "#ff00ff"
+            if i % 5 == 0:
+                sig.sticky = True # 應該在捲動時置頂
+                sig.color = "#00ff00"
+            self.window.project.add_signal(sig)
+        
+        self.window.refresh_list()
+
+    def test_list_matches_project(self):
+        """refresh_list shows every signal, in project order"""
+        signal_list = self.window.signal_list
+        self.assertEqual(signal_list.count(), len(self.window.project.signals))
+        
+        for i, sig in enumerate(self.window.project.signals):
+            self.assertIs(signal_list.item(i).data(Qt.ItemDataRole.UserRole), sig)
+        
+        first = signal_list.item(self.first_new).data(Qt.ItemDataRole.UserRole)
+        self.assertEqual(first.name, "Sig_0")
+        self.assertTrue(first.pinned)
+
+    def test_sticky_overlays_when_scrolled(self):
+        """Sticky signals scrolled above the view are stacked under the header, in order"""
+        canvas = self.window.canvas
+        # Scroll so the first 30 new signals are above the view
+        v_scroll = (self.first_new + 30) * canvas.row_height
+        _, visual_layout = canvas.get_signal_layout(v_scroll)
+        
+        overlays = [(idx, y) for idx, y, is_overlay in visual_layout if is_overlay]
+        expected = [i for i in canvas.get_sticky_indices()
+                    if canvas.header_height + i * canvas.row_height < v_scroll + canvas.header_height]
+        self.assertEqual([idx for idx, _ in overlays], expected)
+        self.assertIn(self.first_new + 25, expected) # Sig_25 is sticky and scrolled away
+        
+        # Stacked directly under the sticky header
+        for n, (_, y) in enumerate(overlays):
+            self.assertEqual(y, v_scroll + canvas.header_height + n * canvas.row_height)
+
+if __name__ == '__main__':
+    unittest.main()
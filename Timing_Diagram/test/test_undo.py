@@ -0,0 +1,69 @@
+import sys
+import unittest
+
+# Add project root to path
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.models import Project, Signal
+from core.undo_manager import UndoManager
+
+class TestUndo(unittest.TestCase):
+    def setUp(self):
+        self.project = Project()
+        self.signal = Signal(name="A", values=['0', '0', '0'])
+        self.project.add_signal(self.signal)
+        self.undo = UndoManager(self.project)
+
+    def toggle(self, cycle):
+        """What the canvas does on a single-cell click"""
+        old = self.signal.get_value_at(cycle)
+        new = '0' if old == '1' else '1'
+        self.signal.set_value_at(cycle, new)
+        self.undo.push_value_change(0, cycle, old, new)
+
+    def test_toggle_undo_redo(self):
+        self.toggle(1)
+        self.assertTrue(self.undo.undo())
+        self.assertEqual(self.project.signals[0].values, ['0', '0', '0'])
+        self.assertTrue(self.undo.redo())
+        self.assertEqual(self.project.signals[0].values, ['0', '1', '0'])
+
+    def test_editor_edit_after_toggle_is_kept(self):
+        """A canvas toggle while the editor holds a pending snapshot must not drop the editor's edit"""
+        self.undo.request_snapshot() # Editor focus
+        self.toggle(1)
+        self.project.signals[0].name = "B" # Editor edit
+        self.undo.commit_snapshot()
+        
+        self.assertTrue(self.undo.undo()) # Editor edit
+        self.assertEqual(self.project.signals[0].name, "A")
+        self.assertEqual(self.project.signals[0].values, ['0', '1', '0'])
+        
+        self.assertTrue(self.undo.undo()) # Toggle
+        self.assertEqual(self.project.signals[0].values, ['0', '0', '0'])
+        self.assertFalse(self.undo.can_undo())
+
+    def test_toggle_reorder_undo(self):
+        """Undoing a toggle after a reorder changes the toggled signal, not the one now at its index"""
+        other = Signal(name="Other", values=['1', '1', '1'])
+        self.project.add_signal(other)
+        self.toggle(1)
+        
+        # What both reorder paths do: snapshot the old order, then move the rows
+        self.undo.push_snapshot()
+        self.project.signals.reverse()
+        
+        self.assertTrue(self.undo.undo()) # Reorder
+        self.assertEqual([s.name for s in self.project.signals], ["A", "Other"])
+        self.assertTrue(self.undo.undo()) # Toggle
+        self.assertEqual(self.project.signals[0].values, ['0', '0', '0'])
+        self.assertEqual(self.project.signals[1].values, ['1', '1', '1'])
+        
+        self.assertTrue(self.undo.redo())
+        self.assertTrue(self.undo.redo())
+        self.assertEqual([s.name for s in self.project.signals], ["Other", "A"])
+        self.assertEqual(self.project.signals[1].values, ['0', '1', '0'])
+
+if __name__ == '__main__':
+    unittest.main()
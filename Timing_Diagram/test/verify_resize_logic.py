@@ -11,12 +11,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.models import Project, Signal, SignalType
 from ui.canvas import WaveformCanvas
 
-class TestResizeLogic(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        # Create App instance
-        cls.app = QApplication(sys.argv)
+# One QApplication for the whole process (reused if another test module already made one)
+_APP = QApplication.instance() or QApplication([])
 
+class TestResizeLogic(unittest.TestCase):
     def setUp(self):
         self.project = Project()
         # Create a signal
@@ -26,18 +24,18 @@ class TestResizeLogic(unittest.TestCase):
         self.project.cycle_width = 20 # 20px per cycle
         
         # Setup Block [5, 10] (Value '1')
-        for t in range(5, 11):
-            self.signal.set_value_at(t, '1')
+        self.signal.set_range(5, 10, '1')
             
         self.canvas = WaveformCanvas(self.project)
         self.canvas.resize(800, 600)
-        self.canvas.show()
+        # Not shown: synthetic mouse events are delivered directly, no window needed
         
         # Geometry constants
         self.header_w = self.canvas.signal_header_width
         self.row_h = self.canvas.row_height
         self.header_h = self.canvas.header_height
         self.cw = self.project.cycle_width
+        self.events = {} # (event_type, cycle_idx) -> QMouseEvent, built once and reused
 
     def get_pos_at_cycle(self, cycle_idx):
         # Center of cycle
@@ -45,23 +43,31 @@ class TestResizeLogic(unittest.TestCase):
         y = self.header_h + 0 * self.row_h + self.row_h // 2
         return QPoint(int(x), int(y))
 
+    def send_mouse(self, event_type, cycle_idx):
+        """Delivers a left-button mouse event at the center of cycle_idx to the canvas handlers.
+           Moves go through the throttled mouseMoveEvent; the throttle timer is then fired
+           directly (no wall-clock wait) so a deferred move is applied before the test checks."""
+        key = (event_type, cycle_idx)
+        event = self.events.get(key)
+        if event is None:
+            event = self.events[key] = QMouseEvent(event_type, QPointF(self.get_pos_at_cycle(cycle_idx)), Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+        if event_type == QEvent.Type.MouseButtonPress:
+            self.canvas.mousePressEvent(event)
+        else:
+            self.canvas.mouseMoveEvent(event)
+            self.canvas._move_timer.timeout.emit() # End the throttle window now
+
     def test_drag_left_moves_start(self):
         """Click Middle, Drag Left -> Should move Start Left (Extend)"""
         # Block is [5, 10]. Middle is ~7.
         # Click at 7
-        start_pos = self.get_pos_at_cycle(7)
-        
-        # Press
-        event = QMouseEvent(QEvent.Type.MouseButtonPress, QPointF(start_pos), Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
-        self.canvas.mousePressEvent(event)
+        self.send_mouse(QEvent.Type.MouseButtonPress, 7)
         
         self.assertTrue(self.canvas.is_editing_duration)
         self.assertIsNone(self.canvas.edit_mode)
         
         # Drag Left to 6 (Diff -20px)
-        target_pos = self.get_pos_at_cycle(6)
-        event = QMouseEvent(QEvent.Type.MouseMove, QPointF(target_pos), Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
-        self.canvas.mouseMoveEvent(event)
+        self.send_mouse(QEvent.Type.MouseMove, 6)
         
         # Check Mode
         self.assertEqual(self.canvas.edit_mode, 'START')
@@ -77,16 +83,10 @@ class TestResizeLogic(unittest.TestCase):
         """Click Middle, Drag Right -> Should move End Right (Extend)"""
         # Block is [5, 10]. Middle is ~7.
         # Click at 7
-        start_pos = self.get_pos_at_cycle(7)
-        
-        # Press
-        event = QMouseEvent(QEvent.Type.MouseButtonPress, QPointF(start_pos), Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
-        self.canvas.mousePressEvent(event)
+        self.send_mouse(QEvent.Type.MouseButtonPress, 7)
         
         # Drag Right to 8 (Diff +20px)
-        target_pos = self.get_pos_at_cycle(8)
-        event = QMouseEvent(QEvent.Type.MouseMove, QPointF(target_pos), Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
-        self.canvas.mouseMoveEvent(event)
+        self.send_mouse(QEvent.Type.MouseMove, 8)
         
         # Check Mode
         self.assertEqual(self.canvas.edit_mode, 'END')
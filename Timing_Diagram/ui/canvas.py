@@ -1,7 +1,20 @@
 from PyQt6.QtWidgets import QWidget, QScrollArea
-from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint, QPointF, QEvent
-from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QBrush, QPainterPath, QMouseEvent, QKeySequence
-from core.models import Project, Signal, SignalType
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint, QPointF, QLine, QEvent
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QBrush, QPolygon, QPolygonF, QMouseEvent, QKeySequence, QPixmap
+from bisect import bisect_right
+from itertools import groupby
+from collections import OrderedDict
+from core.models import Project, Signal, SignalType, value_runs, value_window
+
+# Row tile cache: rows are pre-rendered (background + grid + waveform) in fixed-width tiles
+ROW_TILE_WIDTH = 512
+ROW_TILE_CACHE_SIZE = 256 # Max cached tiles (~80 KB each at 40px rows)
+
+# Points per drawPolyline call: Qt's stroker slows down quadratically with polyline length
+POLYLINE_CHUNK = 256
+
+# Cached clock polylines (one per clock signal / visible range / zoom in practice)
+CLOCK_POLYLINE_CACHE_SIZE = 64
 
 class WaveformCanvas(QWidget):
     # Signal emitted when data changes (e.g. user clicks to toggle bit)
@@ -20,6 +33,10 @@ class WaveformCanvas(QWidget):
     signal_clicked = pyqtSignal(int)
     # Signal emitted before a change that should be undoable
     before_change = pyqtSignal()
+    # Signal emitted before signals are reordered by dragging a row (undo snapshot)
+    before_reorder = pyqtSignal()
+    # Signal emitted when a single cell is toggled (signal_index, cycle_index, old_value, new_value)
+    value_toggled = pyqtSignal(int, int, str, str)
 
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
@@ -44,21 +61,34 @@ class WaveformCanvas(QWidget):
         self.edit_value = None
         self.edit_mode = None # 'START' or 'END'
         self.edit_initial_values = None # Snapshot for drag
+        self.edit_written_span = None # (lo, hi) cells the previous drag step wrote (restored from the snapshot)
+        self.edit_last_span = None # (start, end) painted by the previous drag step
+        self.edit_insert_blockers = None # (left, right) cycles Insert mode cannot grow into (computed once per drag)
         self.is_insert_mode = False # Synchronized from EditorPanel
         
         # Block Move State (Ctrl + Drag)
         self.is_moving_block = False
         self.move_block_info = None # Holds main block info (primary)
-        self.moving_blocks_snapshot = {} # Snapshot for multi-move {key: values}
+        self.moving_blocks_snapshot = {} # Pre-move values for multi-move {sig_idx: values}, only read by build_move_plan
+        self.move_plan = {} # {sig_idx: (values without the moving blocks, [(start, block values)])}, built once per move
+        self.move_last_delta = None # Whole-cycle delta the current previews were built for
         self.move_drag_start_cycle = 0 
         self.drag_start_x = 0 # Pixel start for smooth drag
         self.move_target_cycle = 0
         self.preview_signal_values = {} # {sig_idx: preview_list}
+        self.preview_selection_regions = [] # [(sig_idx, start, end)] at the current (float) drag offset
+        self.move_new_regions_map = {} # {sig_idx: [(sig_idx, start, end)]} where the blocks land
+        self.allow_immediate_move = False # Press on an existing multi-selection: drag moves it without long press
+        self.is_selection_sweeping = False # Ctrl + drag adds blocks to the selection
+        self.pending_selection_reset = False # Click on an already selected block: select only it on release (if not dragged)
+        self.pending_click_region = None
+        self.is_duration_dragged = False # Duration edit actually dragged (not just clicked)
         
         # Paint / Toggle State
         self.paint_start_pos = None
         self.is_painting = False
         self.paint_val = None # '1' or '0'
+        self.paint_changed = False # Any cell written by the current paint drag (data_changed deferred to release)
         
         # Geometry constants
         self.signal_header_width = 100
@@ -84,11 +114,33 @@ class WaveformCanvas(QWidget):
         # Middle-Button Panning State
         self.is_panning = False
         self.pan_start_pos = None
+        self.pan_start_global_pos = None
         self.pan_start_scroll_x = 0
         self.pan_start_scroll_y = 0
         self.middle_long_press_timer = QTimer()
         self.middle_long_press_timer.setSingleShot(True)
         self.middle_long_press_timer.timeout.connect(self.start_panning)
+
+        # Pre-rendered row tiles {(row_key_hash, tile_idx): (row_key, QPixmap)}, LRU ordered
+        self._row_tile_cache = OrderedDict()
+        # Clock waveforms {(period, edge, cw, first, last, ...): QPolygonF}, LRU ordered
+        self._clock_polyline_cache = OrderedDict()
+        # Last get_signal_layout result: (key, (normal_y_map, visual_layout))
+        self._layout_cache = None
+        # Enclosing QScrollArea, resolved once per parent: (parent, scroll area or None)
+        self._scroll_area = (None, None)
+        
+        # Shared pens/brushes by hex color (Signal.color etc.), so repaints don't re-parse colors
+        self._pen_cache = {} # (color, width) -> QPen
+        self._brush_cache = {} # color -> translucent block fill QBrush
+
+        # Mouse-Move Throttling (coalesce move floods to ~60 Hz)
+        self._pending_move = None # Latest deferred move event (copy)
+        self.last_global_pos = None # Global position of the last applied move (auto-scroll replays it)
+        self._move_timer = QTimer()
+        self._move_timer.setInterval(16)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self._flush_pending_move)
         
         self.update_dimensions()
 
@@ -129,12 +181,18 @@ class WaveformCanvas(QWidget):
         Calculates the visual layout mapping:
         - normal_y_map: sig_idx -> absolute y in the widget
         - visual_layout: List of (sig_idx, visual_y, is_sticky_overlay)
+        Queried several times per frame/event with the same inputs, so the last result is reused
+        (callers must not modify the returned containers).
         """
+        sticky_indices = self.get_sticky_indices()
+        key = (v_scroll, len(self.project.signals), tuple(sticky_indices), self.header_height, self.row_height)
+        if self._layout_cache is not None and self._layout_cache[0] == key:
+            return self._layout_cache[1]
+        
         normal_y_map = {}
         for i in range(len(self.project.signals)):
             normal_y_map[i] = self.header_height + i * self.row_height
 
-        sticky_indices = self.get_sticky_indices()
         visual_layout = []
         
         # 1. Add all normal signals (Static background positions)
@@ -150,35 +208,40 @@ class WaveformCanvas(QWidget):
                 visual_layout.append((idx, overlay_y, True))
                 overlay_y += self.row_height
                 
+        self._layout_cache = (key, (normal_y_map, visual_layout))
         return normal_y_map, visual_layout
 
     def get_signal_index_at_y(self, y, v_scroll):
         """Determines signal index at given Y coordinate, considering pinned overlays."""
         _, visual_layout = self.get_signal_layout(v_scroll)
         
-        # Check overlays first (Top-most)
-        overlays = [item for item in visual_layout if item[2]]
+        # Check overlays first (Top-most; they follow the normal rows in visual_layout)
+        overlays = visual_layout[len(self.project.signals):]
         # Sort by visual_y descending to check the one on top of others if they overlap? 
         # Actually sorted ascending (top to bottom) is better.
         for sig_idx, vis_y, is_overlay in reversed(overlays):
             if vis_y <= y < vis_y + self.row_height:
                 return sig_idx
                 
-        # Check normal signals
-        for sig_idx, vis_y, is_overlay in visual_layout:
-            if not is_overlay:
-                if vis_y <= y < vis_y + self.row_height:
-                    return sig_idx
+        # Check normal signals (fixed rows of row_height below the header: direct lookup)
+        sig_idx = int((y - self.header_height) // self.row_height)
+        if 0 <= sig_idx < len(self.project.signals):
+            return sig_idx
                     
         return None
 
     def get_v_scroll(self):
         """Helper to find the vertical scroll value of the parent QScrollArea."""
         parent = self.parent()
-        while parent and not isinstance(parent, QScrollArea):
-            parent = parent.parent()
-        if parent:
-            return parent.verticalScrollBar().value()
+        cached_parent, scroll_area = self._scroll_area
+        if parent is not cached_parent:
+            # (Re)parented: walk up once to the enclosing scroll area
+            scroll_area = parent
+            while scroll_area and not isinstance(scroll_area, QScrollArea):
+                scroll_area = scroll_area.parent()
+            self._scroll_area = (parent, scroll_area)
+        if scroll_area:
+            return scroll_area.verticalScrollBar().value()
         return 0
 
     def render_to_image_object(self, settings):
@@ -221,46 +284,127 @@ class WaveformCanvas(QWidget):
         painter.end()
         return img
 
-    def draw_grid_to_background(self, painter: QPainter, width: int, height: int, v_scroll: int, grid_color=None):
+    def get_pen(self, color: str, width=1):
+        """Returns a shared QPen for a hex color string and width."""
+        key = (color, width)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = self._pen_cache[key] = QPen(QColor(color), width)
+        return pen
+
+    def get_fill_brush(self, color: str):
+        """Returns the shared translucent bus-block fill brush for a hex color string."""
+        brush = self._brush_cache.get(color)
+        if brush is None:
+            fill_color = QColor(color)
+            fill_color.setAlpha(100)
+            brush = self._brush_cache[color] = QBrush(fill_color)
+        return brush
+
+    def draw_polyline(self, painter: QPainter, points: QPolygonF):
+        """drawPolyline in chunks of about POLYLINE_CHUNK points (long exports/zoomed-out views).
+           Chunks are split in the middle of flat segments at an integer x, where the two pen caps
+           only overlap fully covered pixels, so the result matches a single drawPolyline call."""
+        n = len(points)
+        if n <= POLYLINE_CHUNK or painter.opacity() < 1.0 or painter.pen().color().alpha() < 255:
+            painter.drawPolyline(points) # Translucent strokes would blend the overlap twice
+            return
+        
+        chunk_start = 0 # First point of points in the current chunk
+        lead = None # Split point carried over as the first point of the current chunk
+        i = POLYLINE_CHUNK
+        while i < n - 1:
+            a, b = points[i], points[i + 1]
+            if a.y() == b.y():
+                x1, x2 = min(a.x(), b.x()), max(a.x(), b.x())
+                xs = (x1 + x2) // 2
+                if x1 <= xs - 1 and xs + 1 <= x2:
+                    split = QPointF(xs, a.y())
+                    chunk = points.mid(chunk_start, i + 1 - chunk_start)
+                    if lead is not None:
+                        chunk.prepend(lead)
+                    chunk.append(split)
+                    painter.drawPolyline(chunk)
+                    lead = split
+                    chunk_start = i + 1
+                    i += POLYLINE_CHUNK
+                    continue
+            i += 1
+        
+        chunk = points.mid(chunk_start)
+        if lead is not None:
+            chunk.prepend(lead)
+        painter.drawPolyline(chunk)
+
+    def get_cycle_range(self, left, right):
+        """Returns the (first, last) cycles whose columns touch the x-range [left, right].
+           Widened by a small margin so slants/pen widths of neighbouring cycles are included."""
+        cw = self.project.cycle_width
+        margin = 1 + 10 // cw
+        first = max(0, (left - self.signal_header_width) // cw - margin)
+        last = min(self.project.total_cycles - 1, (right - self.signal_header_width) // cw + margin)
+        return first, last
+
+    def draw_grid_to_background(self, painter: QPainter, width: int, height: int, v_scroll: int, grid_color=None, cycle_range=None, row_range=None, y_range=None):
         """Draws vertical cycle lines and horizontal signal separators in the background."""
         cw = self.project.cycle_width
-        if grid_color is None:
-            grid_color = QColor("#282828")
-        painter.setPen(QPen(grid_color, 1))
+        painter.setPen(QPen(grid_color, 1) if grid_color is not None else self.get_pen("#282828"))
 
         # Vertical Cycle Lines
-        for t in range(self.project.total_cycles + 1):
-            x = self.signal_header_width + t * cw
-            painter.drawLine(int(x), v_scroll, int(x), height)
+        first, last = cycle_range if cycle_range else (0, self.project.total_cycles)
+        # Vertical extent (y_range limits it to the repainted band; same pixels inside it)
+        top, bottom = (max(v_scroll, y_range[0]), min(height, y_range[1])) if y_range else (v_scroll, height)
+        # Collected and submitted with one drawLines call instead of a drawLine per line
+        hw = self.signal_header_width
+        lines = [QLine(int(hw + t * cw), top, int(hw + t * cw), bottom) for t in range(first, last + 1)]
 
         # Horizontal Signal Separators
-        for i in range(len(self.project.signals) + 1):
-            y = self.header_height + i * self.row_height
-            painter.drawLine(0, int(y), width, int(y))
+        first, last = row_range if row_range else (0, len(self.project.signals))
+        hh, rh = self.header_height, self.row_height
+        lines.extend(QLine(0, hh + i * rh, width, hh + i * rh) for i in range(first, last + 1))
+        if lines:
+            painter.drawLines(lines)
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
+        # Only the invalidated region is repainted (Qt clips to it); skip rows/cycles outside it
+        dirty = event.region()
+        dirty_rect = dirty.boundingRect()
+        width = self.width()
+        
         # Fill background
-        painter.fillRect(self.rect(), QColor("#1e1e1e"))
+        painter.fillRect(dirty_rect, QColor("#1e1e1e"))
         
         v_scroll = self.get_v_scroll()
         
         # 0. Get Layout
         normal_y_map, visual_layout = self.get_signal_layout(v_scroll)
         
-        # 1. Draw Background Grid (Behind signals)
-        self.draw_grid_to_background(painter, self.width(), self.height(), v_scroll)
-        
-        # 2. Draw Signals (Normal Layer)
-        for sig_idx, y, is_overlay in visual_layout:
-            if is_overlay: continue # Draw overlays later
+        def row_dirty_rect(y):
+            """Dirty part of the row at y, or None if the row needs no repaint."""
+            row_dirty = dirty.intersected(QRect(0, y, width, self.row_height))
+            if row_dirty.isEmpty():
+                return None
+            return row_dirty.boundingRect()
+        
+        # Plan the normal rows first: rows blitted from (opaque) cached tiles already contain
+        # their grid, so the background grid is only drawn where no tile will cover it.
+        # Only the rows crossing the dirty area (normal rows sit at fixed y, one per index)
+        first_row = max(0, (dirty_rect.top() - self.header_height) // self.row_height)
+        last_row = min(len(self.project.signals) - 1, (dirty_rect.bottom() - self.header_height) // self.row_height)
+        row_plan = [] # (sig_idx, y, dirty rect, override, highlights)
+        tiled_ys = []
+        for sig_idx in range(first_row, last_row + 1):
+            y = normal_y_map[sig_idx]
             
             if sig_idx == self.dragging_signal_index:
                 continue
-                
-            signal = self.project.signals[sig_idx]
+            
+            r = row_dirty_rect(y)
+            if r is None:
+                continue
             
             # Check for Preview Override
             override = None
@@ -268,49 +412,92 @@ class WaveformCanvas(QWidget):
                 override = self.preview_signal_values[sig_idx]
             
             highlights = []
-            if self.is_moving_block and hasattr(self, 'preview_selection_regions') and self.preview_selection_regions:
+            if self.is_moving_block and self.preview_selection_regions:
                  for (s_idx, start, end) in self.preview_selection_regions:
                      if s_idx == sig_idx:
                          highlights.append((int(round(start)), int(round(end))))
+            
+            row_plan.append((sig_idx, y, r, override, highlights))
+            if override is None and not highlights and y >= v_scroll:
+                tiled_ys.append(y)
+        
+        # 1. Draw Background Grid (Behind signals), in the vertical gaps between tiled rows
+        grid_range = self.get_cycle_range(dirty_rect.left(), dirty_rect.right())
+        gaps = []
+        gap_top = dirty_rect.top()
+        for y in tiled_ys:
+            if y > gap_top:
+                gaps.append((gap_top, y - 1))
+            gap_top = max(gap_top, y + self.row_height)
+        if gap_top <= dirty_rect.bottom():
+            gaps.append((gap_top, dirty_rect.bottom()))
+        for top, bottom in gaps:
+            # Separators whose (antialiased) line touches the gap: y - 1 <= bottom and y >= top.
+            # Exact, so a separator between two gaps is never blended twice.
+            separator_range = (max(0, -((self.header_height - top) // self.row_height)),
+                               min(len(self.project.signals), (bottom + 1 - self.header_height) // self.row_height))
+            self.draw_grid_to_background(painter, width, self.height(), v_scroll, cycle_range=(grid_range[0], grid_range[1] + 1),
+                                         row_range=separator_range, y_range=(top - 2, bottom + 3))
+        
+        # 2. Draw Signals (Normal Layer)
+        for sig_idx, y, r, override, highlights in row_plan:
+            signal = self.project.signals[sig_idx]
+            
+            if override is None and not highlights and y >= v_scroll:
+                # Plain row (below the scroll top, where grid lines start): blit cached tiles
+                self.draw_signal_tiles(painter, signal, y, r.left(), r.right())
+                continue
                 
-            self.draw_signal(painter, signal, y, is_dragging=False, override_values=override, highlight_ranges=highlights, draw_ui=True)
+            cycle_range = self.get_cycle_range(r.left(), r.right())
+            self.draw_signal(painter, signal, y, is_dragging=False, override_values=override, highlight_ranges=highlights, draw_ui=True, cycle_range=cycle_range)
 
         # 3. Draw Pinned Overlays (Floating Layer)
         # Sort overlays to ensure they stack correctly if needed (already sorted in get_signal_layout)
-        for sig_idx, y, is_overlay in visual_layout:
-            if not is_overlay: continue
+        # Overlays follow the normal rows in visual_layout
+        for sig_idx, y, is_overlay in visual_layout[len(self.project.signals):]:
+            
+            r = row_dirty_rect(y)
+            if r is None:
+                continue
+            cycle_range = self.get_cycle_range(r.left(), r.right())
             
             signal = self.project.signals[sig_idx]
             
             # Draw semi-opaque background for overlay to obscure the scrolling signals behind it
-            painter.fillRect(0, y, self.width(), self.row_height, QColor(30,30,30, 230))
+            painter.fillRect(0, y, width, self.row_height, QColor(30,30,30, 230))
             # Draw a subtle separator at the bottom
-            painter.setPen(QPen(QColor("#444"), 1))
-            painter.drawLine(0, y + self.row_height - 1, self.width(), y + self.row_height - 1)
+            painter.setPen(self.get_pen("#444"))
+            painter.drawLine(0, y + self.row_height - 1, width, y + self.row_height - 1)
             
-            self.draw_signal(painter, signal, y, is_dragging=False, draw_ui=True)
+            self.draw_signal(painter, signal, y, is_dragging=False, draw_ui=True, cycle_range=cycle_range)
 
         # 4. Draw Sticky Header (ON TOP of everything)
-        self.draw_header(painter, v_scroll=v_scroll)
+        header_rect = QRect(0, v_scroll, width, self.header_height + 1)
+        if dirty.intersects(header_rect):
+            r = dirty.intersected(header_rect).boundingRect()
+            self.draw_header(painter, v_scroll=v_scroll, cycle_range=self.get_cycle_range(r.left(), r.right()))
 
         # 3. Draw UI Overlays (Dragged signal, selection, guide)
         if self.dragging_signal_index is not None:
-            v_scroll = self.get_v_scroll()
             signal = self.project.signals[self.dragging_signal_index]
             drag_y = int(self.current_drag_y - self.row_height/2)
-            self.draw_signal(painter, signal, drag_y, is_dragging=True, draw_ui=True)
+            self.draw_signal(painter, signal, drag_y, is_dragging=True, draw_ui=True, cycle_range=grid_range)
             
             # Draw drop indicator
             drop_idx = self.get_drop_index(self.current_drag_y)
             if drop_idx is not None:
                 # Reorder index is always based on NORMAL layout
                 line_y = self.header_height + drop_idx * self.row_height
-                painter.setPen(QPen(QColor("#00ff00"), 2))
+                painter.setPen(self.get_pen("#00ff00", 2))
                 painter.drawLine(0, line_y, self.width(), line_y)
 
+        self.draw_overlays(painter, dirty_rect)
+
+    def draw_overlays(self, painter: QPainter, dirty_rect=None):
+        """Selection highlight, hover guide and move-insert feedback (drawn once, above rows and header)."""
         # Draw Selection Highlight (Standard)
         if self.selected_region and not self.is_moving_block:
-            self.draw_selection_highlight(painter)
+            self.draw_selection_highlight(painter, dirty_rect)
 
         # Draw Cursor/Guide if hovering and NOT dragging
         if self.hover_pos and self.dragging_signal_index is None:
@@ -321,7 +508,7 @@ class WaveformCanvas(QWidget):
             painter.setRenderHint(QPainter.RenderHint.Antialiasing, False) # Sharp lines
             
             # Use Multi-Select Preview if available (Preferred)
-            if hasattr(self, 'preview_selection_regions') and self.preview_selection_regions:
+            if self.preview_selection_regions:
                  # Find min visual start (Float)
                  # This ensures the Red Line is always at the visual HEAD of the group
                  min_start = min(r[1] for r in self.preview_selection_regions)
@@ -334,7 +521,7 @@ class WaveformCanvas(QWidget):
                  x1 = self.signal_header_width + min_start * cw
                  
                  # Red Start Line
-                 painter.setPen(QPen(QColor("#ff0000"), 4))
+                 painter.setPen(self.get_pen("#ff0000", 4))
                  painter.drawLine(int(x1), int(y - 2), int(x1), int(y + self.row_height + 2))
                  
             else:
@@ -355,11 +542,66 @@ class WaveformCanvas(QWidget):
                 y = self.header_height + sig_idx * self.row_height
                 
                 # Red Start Line
-                painter.setPen(QPen(QColor("#ff0000"), 4))
+                painter.setPen(self.get_pen("#ff0000", 4))
                 painter.drawLine(int(x1), int(y - 2), int(x1), int(y + self.row_height + 2))
             
             painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
+    def draw_signal_tiles(self, painter: QPainter, signal: Signal, y: int, left: int, right: int):
+        """Draws the x-range [left, right] of a normal (non-preview) row from cached tiles.
+           A tile holds the row exactly as paintEvent would draw it: background, grid lines
+           and the waveform, so blitting it gives the same pixels as drawing directly."""
+        cw = self.project.cycle_width
+        width = self.width()
+        font = self.font()
+        dpr = self.devicePixelRatioF()
+        # Everything draw_signal/the grid depend on for this row.
+        # Values enter as the cached runs list: Signal.get_runs() hands back the same list object
+        # while values are unchanged, so the key is hashed by its id instead of copying and
+        # hashing every cycle (the key holds the list, so the id can't be reused while cached).
+        runs = signal.get_runs()
+        row_key = (cw, self.project.total_cycles, self.row_height, self.signal_header_width, width, dpr, font.key(),
+                   signal.name, signal.type, signal.color, signal.sticky, signal.clk_rising_edge, signal.clk_mod,
+                   signal.bits, signal.input_base, signal.display_base,
+                   tuple(signal.value_colors.items()), runs)
+        key_hash = hash(row_key[:-1] + (id(runs),))
+        cache = self._row_tile_cache
+        
+        for tile_idx in range(max(0, left) // ROW_TILE_WIDTH, right // ROW_TILE_WIDTH + 1):
+            tile_x = tile_idx * ROW_TILE_WIDTH
+            entry = cache.get((key_hash, tile_idx))
+            if entry is not None and entry[0] == row_key:
+                cache.move_to_end((key_hash, tile_idx))
+                pixmap = entry[1]
+            else:
+                pixmap = QPixmap(int(ROW_TILE_WIDTH * dpr), int(self.row_height * dpr))
+                pixmap.setDevicePixelRatio(dpr)
+                pixmap.fill(QColor("#1e1e1e"))
+                
+                p = QPainter(pixmap)
+                p.setRenderHint(QPainter.RenderHint.Antialiasing)
+                p.setFont(font)
+                p.translate(-tile_x, 0)
+                
+                # Grid (same geometry as draw_grid_to_background, row at y=0)
+                p.setPen(self.get_pen("#282828"))
+                first, last = self.get_cycle_range(tile_x, tile_x + ROW_TILE_WIDTH - 1)
+                hw = self.signal_header_width
+                lines = [QLine(int(hw + t * cw), -10, int(hw + t * cw), self.row_height + 10)
+                         for t in range(first, min(last + 1, self.project.total_cycles) + 1)]
+                lines.append(QLine(0, 0, width, 0))
+                lines.append(QLine(0, self.row_height, width, self.row_height))
+                p.drawLines(lines)
+                
+                self.draw_signal(p, signal, 0, draw_ui=True, cycle_range=(first, last))
+                p.end()
+                
+                cache[(key_hash, tile_idx)] = (row_key, pixmap)
+                if len(cache) > ROW_TILE_CACHE_SIZE:
+                    cache.popitem(last=False) # Evict least recently used
+            
+            painter.drawPixmap(tile_x, y, pixmap)
+
     def get_drop_index(self, y):
         # Calculate which index we would drop into
         # y is the center of the dragged item
@@ -369,14 +611,14 @@ class WaveformCanvas(QWidget):
         idx = max(0, min(idx, len(self.project.signals)))
         return idx
 
-    def draw_header(self, painter: QPainter, font_color=None, width=None, height=None, v_scroll=0, show_selection=True):
+    def draw_header(self, painter: QPainter, font_color=None, width=None, height=None, v_scroll=0, show_selection=True, cycle_range=None):
         if width is None: width = self.width()
         if height is None: height = self.height()
         default_color = QColor("#808080")
         
         # Draw Sticky Background
         painter.fillRect(0, v_scroll, width, self.header_height, QColor("#1e1e1e"))
-        painter.setPen(QPen(QColor("#282828"), 1))
+        painter.setPen(self.get_pen("#282828"))
         painter.drawLine(0, v_scroll + self.header_height, width, v_scroll + self.header_height)
         
         # Draw Cycle Numbers
@@ -389,36 +631,60 @@ class WaveformCanvas(QWidget):
         cw = self.project.cycle_width
         
         regions_to_check = self.selected_regions
-        if self.is_moving_block and hasattr(self, 'preview_selection_regions') and self.preview_selection_regions:
+        if self.is_moving_block and self.preview_selection_regions:
              regions_to_check = self.preview_selection_regions
 
-        for t in range(self.project.total_cycles):
-            x = self.signal_header_width + t * cw
-            rect = QRect(int(x), v_scroll, int(cw), self.header_height)
-            
-            # Highlight selected cycles in header
-            is_selected = False
-            if show_selection:
-                for (sig, start, end) in regions_to_check:
-                    if start <= t <= end:
-                        is_selected = True
-                        painter.fillRect(rect, QColor(255, 170, 0, 80))
-                        break
-            
-            if is_selected:
-                painter.setPen(QColor("#ffffff"))
-                f = painter.font()
-                f.setBold(True)
-                painter.setFont(f)
+        first, last = cycle_range if cycle_range else (0, self.project.total_cycles - 1)
+        
+        # Highlight selected cycles in header
+        selected = []
+        normal = []
+        for t in range(first, last + 1):
+            if show_selection and any(start <= t <= end for (sig, start, end) in regions_to_check):
+                selected.append(t)
             else:
-                painter.setPen(font_color if font_color else default_color)
-                f = painter.font()
-                f.setBold(False)
-                painter.setFont(f)
-            
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(t))
-
-    def draw_signal(self, painter: QPainter, signal: Signal, y: int, is_dragging=False, override_values=None, highlight_ranges=None, width=None, text_color=None, draw_ui=True):
+                normal.append(t)
+        
+        # Draw per state (fills, normal numbers, bold numbers) so pen/font change a few times, not per cycle
+        hw = self.signal_header_width
+        hh = self.header_height
+        cell_w = int(cw)
+        def cell(t):
+            return QRect(int(hw + t * cw), v_scroll, cell_w, hh)
+        
+        align = Qt.AlignmentFlag.AlignCenter
+        
+        # One fill per run of consecutive selected cycles (adjacent cells tile exactly)
+        highlight = QColor(255, 170, 0, 80)
+        for _, run in groupby(enumerate(selected), key=lambda p: p[1] - p[0]):
+            run = list(run)
+            left = int(hw + run[0][1] * cw)
+            painter.fillRect(QRect(left, v_scroll, int(hw + (run[-1][1] + 1) * cw) - left, hh), highlight)
+        
+        normal_font = painter.font()
+        normal_font.setBold(False)
+        bold_font = painter.font()
+        bold_font.setBold(True)
+        normal_pen = font_color if font_color else default_color
+        
+        painter.setPen(normal_pen)
+        painter.setFont(normal_font)
+        for t in normal:
+            painter.drawText(cell(t), align, str(t))
+        
+        if selected:
+            painter.setPen(QColor("#ffffff"))
+            painter.setFont(bold_font)
+            for t in selected:
+                painter.drawText(cell(t), align, str(t))
+        
+        # Leave pen/font as the last cycle set them (text drawn after the header inherits them)
+        if first <= last:
+            last_selected = bool(selected) and selected[-1] == last
+            painter.setPen(QColor("#ffffff") if last_selected else normal_pen)
+            painter.setFont(bold_font if last_selected else normal_font)
+
+    def draw_signal(self, painter: QPainter, signal: Signal, y: int, is_dragging=False, override_values=None, highlight_ranges=None, width=None, text_color=None, draw_ui=True, cycle_range=None):
         if width is None: width = self.width()
         
         if is_dragging:
@@ -438,7 +704,7 @@ class WaveformCanvas(QWidget):
                 painter.drawEllipse(icon_x, icon_y, icon_size, icon_size)
             else:
                 # Hollow Circle for "Off" state
-                painter.setPen(QPen(QColor("#666"), 1.5))
+                painter.setPen(self.get_pen("#666", 1.5))
                 painter.setBrush(Qt.BrushStyle.NoBrush)
                 painter.drawEllipse(icon_x, icon_y, icon_size, icon_size)
             
@@ -464,9 +730,7 @@ class WaveformCanvas(QWidget):
             return signal.get_value_at(t)
 
         # Setup Pen for Waveform
-        base_color = QColor(signal.color)
-        pen = QPen(base_color)
-        pen.setWidth(2)
+        pen = self.get_pen(signal.color, 2)
         painter.setPen(pen)
         
         # Calculate Y levels
@@ -474,67 +738,75 @@ class WaveformCanvas(QWidget):
         mid_y = y + self.row_height // 2
         low_y = y + self.row_height - 5
         
-        path = QPainterPath()
+        # Cycles to draw (all by default; paintEvent passes only the dirty columns)
+        first, last = cycle_range if cycle_range else (0, self.project.total_cycles - 1)
         
         # --- BUS RENDER LOGIC (Merged) ---
         if signal.type in [SignalType.BUS_DATA, SignalType.BUS_STATE]:
-            # Group consecutive identical values
-            groups = []
-            if self.project.total_cycles > 0:
-                current_val = get_val(0)
-                current_start = 0
-                for t in range(1, self.project.total_cycles):
-                    val = get_val(t)
-                    if val != current_val:
-                        groups.append((current_start, t - 1, current_val))
-                        current_val = val
-                        current_start = t
-                groups.append((current_start, self.project.total_cycles - 1, current_val))
-
+            # Widen to whole blocks so clipped blocks keep their full shape and centered text
+            if first <= last and override_values is None:
+                # Cached runs of the signal itself: pick the ones overlapping [first, last]
+                groups = self.get_runs_in_range(signal, first, last)
+            elif first <= last:
+                # Extend each end by the length of the equal-valued run next to it
+                # (groupby counts it in C instead of stepping one cycle at a time)
+                first_val = get_val(first)
+                for val, grp in groupby(reversed(value_window(override_values, 0, first - 1))):
+                    if val == first_val:
+                        first -= len(list(grp))
+                    break
+                last_val = get_val(last)
+                for val, grp in groupby(value_window(override_values, last + 1, self.project.total_cycles - 1)):
+                    if val == last_val:
+                        last += len(list(grp))
+                    break
+            
+                # Group consecutive identical values
+                groups = value_runs(override_values, first, last)
+            else:
+                groups = []
+
+            # Blocks are drawn in order (later blocks, labels included, layer over earlier ones);
+            # pen and brush are only set when they differ from the current ones. Lines and text
+            # ignore the brush, so the fill brush stays set until the fill color changes.
+            normal_pen = pen
+            highlight_pen = self.get_pen("#ffffff", 3) # Bold White
+            text_pen = text_color if text_color else QColor("#ffffff")
+            current_pen = current_brush = None
+            
+            # Highlight ranges sorted by start, with the furthest end reached so far:
+            # a block overlaps some range iff the last range starting at/before its end reaches its start
+            hl_starts, hl_reach = [], []
+            for hs, he in sorted(highlight_ranges or ()):
+                if he < hs:
+                    continue # Empty range
+                hl_starts.append(hs)
+                hl_reach.append(max(he, hl_reach[-1]) if hl_reach else he)
+            
             for start_t, end_t, val in groups:
                 # Calculate coordinates
                 x1 = start_x + start_t * cw
                 x2 = start_x + (end_t + 1) * cw # End of the last cycle
                 
-                # Determine Fill Color (Custom if set)
-                fill_color = base_color
-                if val is not None and val in signal.value_colors:
-                    fill_color = QColor(signal.value_colors[val])
-                
-                # Draw Hexagon/Bus shape
-                path = QPainterPath() # New path per block for bus
-                
                 # Always use base signal color for outline (User Request)
                 # Unless Highlighted
-                is_highlighted = False
-                if highlight_ranges:
-                    # Check if this block (start_t, end_t) is inside any highlight range
-                    # Relaxed check: overlap or containment
-                    for (hs, he) in highlight_ranges:
-                        # If block is roughly within the highlight range
-                        # highlight range is the box. Block should be inside.
-                        if start_t >= hs and end_t <= he:
-                            is_highlighted = True
-                            break
-                        # Overlap check (safer for edge cases)
-                        if max(start_t, hs) <= min(end_t, he):
-                             is_highlighted = True
-                             break
-                
-                if is_highlighted:
-                     painter.setPen(QPen(QColor("#ffffff"), 3)) # Bold White
-                else:
-                     painter.setPen(QPen(base_color, 2))
+                # Highlighted if the block overlaps (or lies inside) any highlight range
+                i = bisect_right(hl_starts, end_t) - 1
+                is_highlighted = i >= 0 and hl_reach[i] >= start_t
+                outline_pen = highlight_pen if is_highlighted else normal_pen
+                if outline_pen is not current_pen:
+                    painter.setPen(outline_pen)
+                    current_pen = outline_pen
                 
                 if val == 'Z':
-                    painter.drawLine(x1, mid_y, x2, mid_y)
+                    painter.drawLine(int(x1), int(mid_y), int(x2), int(mid_y))
                 else:
                     # Polygon for [start_t, end_t]
                     # Indent slightly for slant
                     slant = 5
                     # Be careful with adjacent blocks
                     
-                    poly_pts = [
+                    poly = QPolygon([
                         QPoint(int(x1), int(mid_y)),
                         QPoint(int(x1 + slant), int(high_y)),
                         QPoint(int(x2 - slant), int(high_y)),
@@ -542,108 +814,153 @@ class WaveformCanvas(QWidget):
                         QPoint(int(x2 - slant), int(low_y)),
                         QPoint(int(x1 + slant), int(low_y)),
                         QPoint(int(x1), int(mid_y))
-                    ]
+                    ])
                     
-                    # Fill logic
-                    # Use the custom fill color with transparency
-                    painter.setBrush(QBrush(QColor(fill_color.red(), fill_color.green(), fill_color.blue(), 100)))
-                    painter.drawPolygon(poly_pts)
-                    painter.setBrush(Qt.BrushStyle.NoBrush)
+                    # Use the custom fill color (if set) with transparency
+                    fill_key = signal.value_colors.get(val) if val is not None else None
+                    brush = self.get_fill_brush(fill_key if fill_key is not None else signal.color)
+                    if brush is not current_brush:
+                        painter.setBrush(brush)
+                        current_brush = brush
+                    painter.drawPolygon(poly)
                     
                     # Draw Text - Centered in the whole merged block
                     text_rect = QRect(int(x1), int(high_y), int(x2-x1), int(low_y - high_y))
-                    painter.setPen(text_color if text_color else QColor("#ffffff"))
-                    
+                    painter.setPen(text_pen)
+                    current_pen = text_pen
                     # --- Automatic Conversion for BUS_DATA ---
-                    display_text = signal.format_bus_value(val)
-                    painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, display_text)
+                    painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, signal.format_bus_value(val))
+            
+            painter.setBrush(Qt.BrushStyle.NoBrush)
 
         # --- BINARY RENDER LOGIC (Cycle by Cycle usually fine, but path is continuous) ---
         else: 
-            for t in range(self.project.total_cycles):
-                curr_x = start_x + t * cw
-                next_x = curr_x + cw
-                
-                if signal.type == SignalType.CLK:
-                    # --- Custom Clock Render Logic (Sub-cycle precision) ---
-                    # Period is defined by clk_mod (1 = 1 cycle, 2 = 2 cycles, etc.)
-                    period = max(1, signal.clk_mod)
-                    half = period / 2.0
-                    
-                    # 1. Determine Start State at 't'
-                    phase = t % period
-                    is_first_half = (phase < half)
-                    
-                    # Logic: Rising Edge = Start High (Transition 0->1 happens AT the boundary)
-                    is_high = is_first_half if signal.clk_rising_edge else (not is_first_half)
-                    
-                    curr_val = '1' if is_high else '0'
-                    curr_y = high_y if curr_val == '1' else low_y
-                    
-                    if t == 0:
-                        path.moveTo(curr_x, curr_y)
-                        
-                    # 2. Check for Mid-Cycle Switch
-                    # Occurs if (t + 0.5) is a multiple of (period/2)
-                    # Specifically, if (2*t + 1) % period == 0
-                    if (2 * t + 1) % period == 0:
-                        mid_x = curr_x + cw / 2.0
-                        path.lineTo(mid_x, curr_y)
-                        
-                        # Invert for second half
-                        opp_y = low_y if curr_val == '1' else high_y
-                        path.lineTo(mid_x, opp_y)
-                        path.lineTo(next_x, opp_y)
-                        curr_y = opp_y # End Y for vertical transition check
-                    else:
-                        path.lineTo(next_x, curr_y)
-                        
-                    # 3. Vertical Transition to Next Cycle
-                    if t < self.project.total_cycles - 1:
-                        phase_next = (t + 1) % period
-                        is_first_half_next = (phase_next < half)
-                        is_high_next = is_first_half_next if signal.clk_rising_edge else (not is_first_half_next)
-                        
-                        next_y = high_y if is_high_next else low_y
-                        if curr_y != next_y:
-                            path.lineTo(next_x, next_y)
-                            
+            if signal.type != SignalType.CLK:
+                # --- Standard Binary Signal Logic ---
+                # One segment per run of identical values (grouped in C) instead of one per cycle.
+                # The run after `last` (if any) only supplies the level for the final transition.
+                runs_last = last + 1 if last < self.project.total_cycles - 1 else last
+                if first > last:
+                    runs = []
+                elif override_values is None:
+                    # The signal's cached runs (shared with the bus path, tiles and export), clipped to the range
+                    runs = [(max(start_t, first), min(end_t, runs_last), val)
+                            for start_t, end_t, val in self.get_runs_in_range(signal, first, runs_last)]
                 else:
-                    # --- Standard Binary Signal Logic ---
-                    val = get_val(t)
+                    runs = value_runs(override_values, first, runs_last)
+                # Binary/clock waveform: one polyline. Points are collected in a Python list and
+                # converted in one call (cheaper than a QPolygonF.append crossing per point)
+                pts = []
+                prev_y = None
+                for start_t, end_t, val in runs:
                     curr_y = high_y if val == '1' else low_y
+                    x = start_x + start_t * cw
                     
-                    if t == 0:
-                        path.moveTo(curr_x, curr_y)
+                    if prev_y is None:
+                        pts.append(QPointF(x, curr_y))
+                    elif curr_y != prev_y:
+                        # Draw Vertical Transition
+                        pts.append(QPointF(x, curr_y))
                     
-                    path.lineTo(next_x, curr_y)
-                    
-                    # Draw Vertical Transition
-                    if t < self.project.total_cycles - 1:
-                        next_val = get_val(t+1)
-                        next_y = high_y if next_val == '1' else low_y
-                        
-                        if curr_y != next_y:
-                            path.lineTo(next_x, next_y)
+                    if start_t <= last:
+                        pts.append(QPointF(start_x + (min(end_t, last) + 1) * cw, curr_y))
+                    prev_y = curr_y
+                points = QPolygonF(pts)
+            else:
+                points = self.get_clock_polyline(signal, first, last, start_x, high_y, low_y)
             
-            painter.setPen(QPen(base_color, 2))
-            painter.drawPath(path)
+            painter.setPen(pen)
+            self.draw_polyline(painter, points)
             
         if is_dragging:
             painter.setOpacity(1.0)
 
 
-    def draw_selection_highlight(self, painter: QPainter):
-        # Draw All Selected Regions
+    def get_clock_polyline(self, signal: Signal, first: int, last: int, start_x, high_y, low_y) -> QPolygonF:
+        """Clock waveform points for cycles first..last. The shape only depends on a few constants
+           (period, edge, zoom, position), so it is built once and reused from an LRU cache."""
+        cw = self.project.cycle_width
+        total = self.project.total_cycles
+        # Period is defined by clk_mod (1 = 1 cycle, 2 = 2 cycles, etc.)
+        period = max(1, signal.clk_mod)
+        half = period / 2.0
+        rising = signal.clk_rising_edge
+        key = (period, rising, cw, first, last, total, start_x, high_y, low_y)
+        cache = self._clock_polyline_cache
+        points = cache.get(key)
+        if points is not None:
+            cache.move_to_end(key)
+            return points
+        
+        pts = [] # Converted to a QPolygonF once at the end
+        for t in range(first, last + 1):
+            curr_x = start_x + t * cw
+            next_x = curr_x + cw
+            
+            # --- Custom Clock Render Logic (Sub-cycle precision) ---
+            # 1. Determine Start State at 't'
+            phase = t % period
+            is_first_half = (phase < half)
+            
+            # Logic: Rising Edge = Start High (Transition 0->1 happens AT the boundary)
+            is_high = is_first_half if rising else (not is_first_half)
+            
+            curr_val = '1' if is_high else '0'
+            curr_y = high_y if curr_val == '1' else low_y
+            
+            if t == first:
+                pts.append(QPointF(curr_x, curr_y))
+                
+            # 2. Check for Mid-Cycle Switch
+            # Occurs if (t + 0.5) is a multiple of (period/2)
+            # Specifically, if (2*t + 1) % period == 0
+            if (2 * t + 1) % period == 0:
+                mid_x = curr_x + cw / 2.0
+                pts.append(QPointF(mid_x, curr_y))
+                
+                # Invert for second half
+                opp_y = low_y if curr_val == '1' else high_y
+                pts.append(QPointF(mid_x, opp_y))
+                pts.append(QPointF(next_x, opp_y))
+                curr_y = opp_y # End Y for vertical transition check
+            else:
+                pts.append(QPointF(next_x, curr_y))
+                
+            # 3. Vertical Transition to Next Cycle
+            if t < total - 1:
+                phase_next = (t + 1) % period
+                is_first_half_next = (phase_next < half)
+                is_high_next = is_first_half_next if rising else (not is_first_half_next)
+                
+                next_y = high_y if is_high_next else low_y
+                if curr_y != next_y:
+                    pts.append(QPointF(next_x, next_y))
+        
+        points = cache[key] = QPolygonF(pts)
+        if len(cache) > CLOCK_POLYLINE_CACHE_SIZE:
+            cache.popitem(last=False) # Evict least recently used
+        return points
+
+    def draw_selection_highlight(self, painter: QPainter, dirty_rect=None):
+        # Draw All Selected Regions (those touching dirty_rect, if given)
         cw = self.project.cycle_width
         v_scroll = self.get_v_scroll()
         
         # Use Preview regions if moving, else actual selection
         regions_to_draw = self.selected_regions
-        if self.is_moving_block and hasattr(self, 'preview_selection_regions') and self.preview_selection_regions:
+        if self.is_moving_block and self.preview_selection_regions:
             regions_to_draw = self.preview_selection_regions
         
         normal_y_map, visual_layout = self.get_signal_layout(v_scroll)
+        # Visual rows per signal (normal + overlay), grouped once instead of scanned per region
+        rows = {}
+        for item in visual_layout:
+            rows.setdefault(item[0], []).append(item[1])
+        
+        border_pen = self.get_pen("#ffaa00", 3) # Orange highlight
+        line_pen = QPen(QColor(255, 255, 255, 100), 1, Qt.PenStyle.DotLine)
+        header_bottom = int(v_scroll + self.header_height)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
 
         for (sig_idx, start, end) in regions_to_draw:
             if sig_idx >= len(self.project.signals): continue
@@ -652,23 +969,26 @@ class WaveformCanvas(QWidget):
             x2 = self.signal_header_width + (end + 1) * cw
             
             # Use visual_y for highlight!
-            # Find visual_y from layout. We check if there's an overlay for this signal.
             # If multiple instances (normal + overlay), we highlight both? 
             # Usually users expect the one they see to be highlighted.
-            y_positions = [item[1] for item in visual_layout if item[0] == sig_idx]
-            
-            for y in y_positions:
+            for y in rows.get(sig_idx, ()):
                 rect = QRect(int(x1), int(y), int(x2 - x1), int(self.row_height))
                 
+                # Skip highlights entirely outside the repainted area (border + lines up to the header)
+                if dirty_rect is not None:
+                    top = min(int(y), header_bottom)
+                    bounds = QRect(rect.left(), top, rect.width(), max(rect.bottom(), header_bottom) - top + 1)
+                    if not dirty_rect.intersects(bounds.adjusted(-3, -3, 3, 3)):
+                        continue
+                
                 # Outer glow/border
-                painter.setPen(QPen(QColor("#ffaa00"), 3)) # Orange highlight
-                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.setPen(border_pen)
                 painter.drawRect(rect)
                 
                 # Vertical lines extending to the sticky header
-                painter.setPen(QPen(QColor(255, 255, 255, 100), 1, Qt.PenStyle.DotLine))
-                painter.drawLine(int(x1), int(y), int(x1), int(v_scroll + self.header_height))
-                painter.drawLine(int(x2), int(y), int(x2), int(v_scroll + self.header_height))
+                painter.setPen(line_pen)
+                painter.drawLine(int(x1), int(y), int(x1), header_bottom)
+                painter.drawLine(int(x2), int(y), int(x2), header_bottom)
         
     def draw_guide(self, painter: QPainter):
         if not self.hover_pos: return
@@ -689,6 +1009,26 @@ class WaveformCanvas(QWidget):
             painter.drawRect(0, int(y), int(self.width()), int(self.row_height))
         
 
+    def get_runs_in_range(self, signal, first, last):
+        """Whole (start, end, value) blocks of signal overlapping cycles [first, last],
+           clipped to total_cycles; cycles past the end of values read as 'X'."""
+        total = self.project.total_cycles
+        runs = signal.get_runs()
+        n = len(signal.values)
+        groups = []
+        for start, end, val in runs[max(0, bisect_right(signal.get_run_starts(), first) - 1):]:
+            if start > last:
+                break
+            if end == n - 1 and val == 'X':
+                end = total - 1 # Trailing 'X' merges with the 'X' padding
+            end = min(end, total - 1)
+            if end >= first:
+                groups.append((start, end, val))
+        # 'X' padding after the last value (unless already merged above)
+        if n <= last and (not runs or runs[-1][2] != 'X'):
+            groups.append((n, total - 1, 'X'))
+        return groups
+
     def get_block_bounds(self, signal, cycle_idx):
         """Helper to find the start and end cycles of a contiguous value block."""
         if cycle_idx < 0 or cycle_idx >= self.project.total_cycles:
@@ -700,29 +1040,43 @@ class WaveformCanvas(QWidget):
         
         # Only expand for defined values (Not 'X')
         if val != 'X':
-            # Scan Left
-            for t in range(cycle_idx, -1, -1):
-                if signal.get_value_at(t) == val: 
-                    o_start = t
-                else: 
-                    break
-            
-            # Scan Right
-            for t in range(cycle_idx, self.project.total_cycles):
-                if signal.get_value_at(t) == val: 
-                    o_end = t
-                else: 
-                    break
+            # A defined value implies cycle_idx < len(values)
+            o_start, o_end = signal.get_run_bounds(cycle_idx)
+            o_end = min(o_end, self.project.total_cycles - 1)
                 
         return o_start, o_end, val
 
     def mouseMoveEvent(self, event):
+        # Duration edit still waiting for a drag direction: decide it synchronously
+        if self.is_editing_duration and self.edit_mode is None:
+            self._pending_move = None
+            self._apply_mouse_move(event)
+            return
+        
+        if self._move_timer.isActive():
+            # Inside the throttle window: keep only the latest position (Qt deletes the original)
+            self._pending_move = event.clone()
+            return
+        
+        self._move_timer.start()
+        self._apply_mouse_move(event)
+
+    def _flush_pending_move(self):
+        """Applies the move coalesced during the last throttle window, if any."""
+        if self._pending_move is None:
+            return
+        event = self._pending_move
+        self._pending_move = None
+        self._move_timer.start() # Keep throttling while moves keep coming
+        self._apply_mouse_move(event)
+
+    def _apply_mouse_move(self, event):
         x = event.pos().x()
         y = event.pos().y()
         self.last_global_pos = event.globalPosition()
         
         # 0. Handle Panning (Middle Button Long Press)
-        if self.is_panning and hasattr(self, 'pan_start_global_pos'):
+        if self.is_panning and self.pan_start_global_pos is not None:
             delta = event.globalPosition().toPoint() - self.pan_start_global_pos
             
             parent = self.parent()
@@ -737,6 +1091,7 @@ class WaveformCanvas(QWidget):
         v_scroll = self.get_v_scroll()
         
         # Update Hover Pos immediately
+        prev_hover = self.hover_pos
         if x > self.signal_header_width:
             cw = self.project.cycle_width
             h_cycle_idx = (x - self.signal_header_width) // cw
@@ -755,7 +1110,7 @@ class WaveformCanvas(QWidget):
         is_dragging_any = (self.is_painting or 
                            self.is_moving_block or 
                            self.is_editing_duration or 
-                           getattr(self, 'is_selection_sweeping', False) or
+                           self.is_selection_sweeping or
                            self.dragging_signal_index is not None)
                            
         if is_dragging_any:
@@ -797,14 +1152,14 @@ class WaveformCanvas(QWidget):
                 # If we moved, it's a normal drag (Duration Edit or Paint), NOT a long press move
         
         # --- IMMEDIATE MOVE (Multi-Selection) ---
-        if getattr(self, 'allow_immediate_move', False) and not self.is_moving_block:
+        if self.allow_immediate_move and not self.is_moving_block:
              diff = (event.pos() - self.press_start_pos).manhattanLength() if self.press_start_pos else 0
              if diff > 5:
                   self.start_moving_block()
                   return # Stop processing (don't paint or duration edit)
         
         # --- SWEEP SELECTION (Ctrl + Drag) ---
-        if getattr(self, 'is_selection_sweeping', False):
+        if self.is_selection_sweeping:
             if self.hover_pos:
                 sig_idx, cycle_idx = self.hover_pos
                 if 0 <= sig_idx < len(self.project.signals):
@@ -839,16 +1194,14 @@ class WaveformCanvas(QWidget):
                     signal = self.project.signals[sig_idx]
                     if signal.type in [SignalType.INPUT, SignalType.OUTPUT, SignalType.INOUT]:
                          cw = self.project.cycle_width
-                         # Use round logic
-                         cycle_idx = int(round((x - self.signal_header_width) / cw))
-                         # Floor logic might be better for "painting over cycle X", 
-                         # but consistent with cursor is good.
                          # Paint implies touching the cycle.
                          # Let's use standard floor index for "cell under mouse".
                          cycle_idx = int((x - self.signal_header_width) / cw)
                          
-                         if cycle_idx >= 0:
+                         # Visible cells already holding the paint value (e.g. re-crossed) need no write or repaint
+                         if cycle_idx >= 0 and (cycle_idx >= self.project.total_cycles or signal.get_value_at(cycle_idx) != self.paint_val):
                              signal.set_value_at(cycle_idx, self.paint_val)
+                             self.paint_changed = True
                              
                              # Auto-expand ONLY if not auto-scrolling
                              if cycle_idx >= self.project.total_cycles:
@@ -857,7 +1210,7 @@ class WaveformCanvas(QWidget):
                                      self.cycles_changed.emit(self.project.total_cycles)
                                      self.update_dimensions()
 
-                             self.data_changed.emit()
+                             # data_changed (full repaint + dirty flag) is emitted once on release
                              self.update()
         if self.is_moving_block:
              cw = self.project.cycle_width
@@ -871,90 +1224,49 @@ class WaveformCanvas(QWidget):
              current_cycle = max(0, current_cycle) 
              self.move_target_cycle = self.move_drag_start_cycle + delta
              
-             # Re-generate previews for ALL moving blocks
-             self.preview_signal_values = {} # Reset
-             if not hasattr(self, 'move_new_regions_map'):
-                 self.move_new_regions_map = {} 
-             self.move_new_regions_map = {} # Reset map
-             
-             # Group moves by signal index
-             signals_to_update = {}
-             # Sort selection first to handle multi-select cleanly
-             sorted_sel = sorted(self.selected_regions, key=lambda r: (r[0], r[1]))
-             
-             for region in sorted_sel:
-                 s_idx = region[0]
-                 if s_idx not in signals_to_update:
-                     signals_to_update[s_idx] = []
-                 signals_to_update[s_idx].append(region)
-             
-             for s_idx, regions in signals_to_update.items():
-                 if s_idx not in self.moving_blocks_snapshot:
-                     continue # Should have snapshot
-                 
-                 # Base content (Original signal state)
-                 orig_full_values = self.moving_blocks_snapshot[s_idx]
-                 preview = list(orig_full_values)
-                 
-                 # 1. DELETE STEP (Remove all moving blocks from the timeline)
-                 # Sort regions Descending to avoid index shift issues during delete
-                 regions_desc = sorted(regions, key=lambda r: r[1], reverse=True)
+             # Data previews only change with the whole-cycle delta; sub-cycle moves just slide the highlight
+             if delta != self.move_last_delta:
+                 self.move_last_delta = delta
                  
-                 for _, start, end in regions_desc:
-                     # Remove [start, end]
-                     if start < len(preview):
-                         # Handle end bound
-                         safe_end = min(end, len(preview) - 1)
-                         if safe_end >= start:
-                             del preview[start : safe_end + 1]
-
-                 # 2. PREPARE INSERTION TASKS
-                 insert_tasks = []
-                 regions_asc = sorted(regions, key=lambda r: r[1])
-                 
-                 for _, start, end in regions_asc:
-                     # Extract the block values from original snapshot
-                     block_vals = []
-                     if start < len(orig_full_values):
-                         safe_end = min(end, len(orig_full_values) - 1)
-                         block_vals = orig_full_values[start : safe_end + 1]
-                     else:
-                         block_vals = ['X'] * (end - start + 1)
-                         
-                     # Target Start = Original Start + Delta
-                     target_start = start + delta
-                     
-                     insert_tasks.append({
-                         'target': target_start,
-                         'values': block_vals
-                     })
-                 
-                 # 3. APPLY INSERTIONS
-                 # Sort by target index ascending
-                 insert_tasks.sort(key=lambda x: x['target'])
+                 # Re-generate previews for ALL moving blocks
+                 self.preview_signal_values = {} # Reset
+                 self.move_new_regions_map = {} # Reset map
+             
+                 for s_idx, (base, blocks) in self.move_plan.items():
+                     # The moving blocks were already cut out at move start; only re-insert them at the new offset.
+                     # The preview is assembled front to back in one pass (base up to each target, then the
+                     # block) instead of shifting the list tail on every insertion.
+                     preview = []
+                     pos = 0 # Next cycle of base not yet copied into preview
                  
-                 self.move_new_regions_map[s_idx] = []
+                     # 2. APPLY INSERTIONS (blocks are in ascending start order, i.e. ascending target)
+                     self.move_new_regions_map[s_idx] = []
                  
-                 for task in insert_tasks:
-                     tgt = task['target']
-                     vals = task['values']
+                     for start, vals in blocks:
+                         # Target Start = Original Start + Delta
+                         tgt = start + delta
                      
-                     if tgt < 0: tgt = 0
+                         if tgt < 0: tgt = 0
                      
-                     # Check bounds and Pad if needed
-                     curr_len = len(preview)
-                     if tgt > curr_len:
-                         preview.extend(['X'] * (tgt - curr_len))
-                         tgt = len(preview) # Cap at end after extension
-                     
-                     # Insert
-                     preview[tgt:tgt] = vals
+                         if tgt >= len(preview):
+                             # Copy base up to the target; Pad if needed (then cap at end after extension)
+                             chunk = base[pos:pos + tgt - len(preview)]
+                             pos += len(chunk)
+                             preview.extend(chunk)
+                             if pos == len(base):
+                                 preview.extend(['X'] * (tgt - len(preview)))
+                             tgt = len(preview)
+                             preview.extend(vals)
+                         else:
+                             # Overlapping blocks: target lies inside what was already assembled
+                             preview[tgt:tgt] = vals
                      
-                     # Record position
-                     new_end = tgt + len(vals) - 1
-                     self.move_new_regions_map[s_idx].append((s_idx, tgt, new_end))
-
-                 self.preview_signal_values[s_idx] = preview
+                         # Record position
+                         new_end = tgt + len(vals) - 1
+                         self.move_new_regions_map[s_idx].append((s_idx, tgt, new_end))
+                 
+                     preview.extend(base[pos:])
+                     self.preview_signal_values[s_idx] = preview
              
              # Decoupled Visual Preview: Visualize FLOAT delta (Smooth Sliding)
              self.preview_selection_regions = []
@@ -981,6 +1293,7 @@ class WaveformCanvas(QWidget):
                      self.project.total_cycles = current_cycle + 1
                      self.cycles_changed.emit(self.project.total_cycles)
                      self.update_dimensions()
+                     self.edit_last_span = None # Header/grid changed: repaint everything
                  else:
                      # Cap at current end when auto-scrolling
                      current_cycle = self.project.total_cycles - 1
@@ -989,7 +1302,15 @@ class WaveformCanvas(QWidget):
              
              # Restore state from start of drag
              if self.edit_initial_values:
-                 signal.values = list(self.edit_initial_values)
+                 initial = self.edit_initial_values
+                 span = self.edit_written_span
+                 if span is None or len(signal.values) < len(initial):
+                     signal.values = list(initial)
+                 else:
+                     # Only the cells the previous step wrote (plus any extension) differ from the snapshot
+                     lo, hi = span
+                     del signal.values[len(initial):]
+                     signal.values[lo:hi + 1] = initial[lo:hi + 1]
 
              # --- Determine Edit Mode from Drag Direction (If not yet set) ---
              if self.edit_mode is None:
@@ -1011,29 +1332,17 @@ class WaveformCanvas(QWidget):
              right_bound = self.project.total_cycles - 1
              
              if self.is_insert_mode:
-                 # Find bounds based on initial state. 
+                 # Find bounds based on initial state (fixed for the whole drag, so searched once).
                  # We can only expand into 'X' or our own value (effectively shrinking or re-occupying).
                  # We cannot expand into other defined values.
+                 if self.edit_insert_blockers is None:
+                     self.edit_insert_blockers = self.find_insert_blockers()
+                 left_blocker, right_blocker = self.edit_insert_blockers
                  
-                 # 1. Left Bound search (Scan left from orig_start - 1)
-                 for t in range(self.edit_orig_start - 1, -1, -1):
-                     val_at_t = 'X'
-                     if t < len(self.edit_initial_values):
-                         val_at_t = self.edit_initial_values[t]
-                         
-                     if val_at_t != 'X' and val_at_t != self.edit_value:
-                         left_bound = t + 1
-                         break
-                
-                 # 2. Right Bound search (Scan right from orig_end + 1)
-                 for t in range(self.edit_orig_end + 1, self.project.total_cycles):
-                     val_at_t = 'X'
-                     if t < len(self.edit_initial_values):
-                         val_at_t = self.edit_initial_values[t]
-                         
-                     if val_at_t != 'X' and val_at_t != self.edit_value:
-                         right_bound = t - 1
-                         break
+                 if left_blocker is not None:
+                     left_bound = left_blocker + 1
+                 if right_blocker is not None and right_blocker < self.project.total_cycles:
+                     right_bound = right_blocker - 1
              
              # RELATIVE DRAG LOGIC
              delta = current_cycle - self.edit_start_cycle
@@ -1050,13 +1359,11 @@ class WaveformCanvas(QWidget):
                  
                  # 1. Fill Content [orig_start, new_end]
                  # Note: signal.values might need extension if final_end > len
-                 for t in range(final_start, final_end + 1):
-                     signal.set_value_at(t, self.edit_value)
+                 signal.set_range(final_start, final_end, self.edit_value)
                      
                  # 2. Clear Excess [new_end+1, orig_end] (SHRINKING FROM RIGHT)
                  if final_end < self.edit_orig_end:
-                     for t in range(final_end + 1, self.edit_orig_end + 1):
-                         signal.set_value_at(t, 'X')
+                     signal.set_range(final_end + 1, self.edit_orig_end, 'X')
                          
              elif self.edit_mode == 'START':
                  # Adjust Left Edge
@@ -1066,19 +1373,23 @@ class WaveformCanvas(QWidget):
                  final_end = self.edit_orig_end
                  
                  # 1. Fill Content [new_start, orig_end]
-                 for t in range(final_start, final_end + 1):
-                     signal.set_value_at(t, self.edit_value)
+                 signal.set_range(final_start, final_end, self.edit_value)
                      
                  # 2. Clear Excess [orig_start, new_start-1] (SHRINKING FROM LEFT)
                  if final_start > self.edit_orig_start:
-                     for t in range(self.edit_orig_start, final_start):
-                         signal.set_value_at(t, 'X')
+                     signal.set_range(self.edit_orig_start, final_start - 1, 'X')
+             
+             if self.edit_mode in ('END', 'START'):
+                 # Cells written above, restored at the start of the next step
+                 self.edit_written_span = (min(final_start, self.edit_orig_start), max(final_end, self.edit_orig_end))
             
-             self.data_changed.emit()
-             # Emit update to sync Editor Panel
-             self.region_updated.emit(self.edit_signal_index, final_start, final_end)
+             # data_changed (full repaint + dirty flag) is emitted once on release
+             # Emit update to sync Editor Panel (only when the span changed: moves within a cycle
+             # or against a clamp would just re-set the same spinner values)
+             if (final_start, final_end) != self.edit_last_span:
+                 self.region_updated.emit(self.edit_signal_index, final_start, final_end)
                  
-             self.update()
+             self.update_duration_edit(prev_hover, final_start, final_end)
              return
 
         if self.reorder_candidate_idx is not None:
@@ -1103,11 +1414,89 @@ class WaveformCanvas(QWidget):
             
             if 0 <= sig_idx < len(self.project.signals) and 0 <= cycle_idx < self.project.total_cycles:
                 self.hover_pos = (sig_idx, cycle_idx)
-                self.update()
-                return
-
-        self.hover_pos = None
-        self.update()
+            else:
+                self.hover_pos = None
+        else:
+            self.hover_pos = None
+        
+        # Only the guide moved: repaint its old and new column/row, not the whole canvas
+        if self.hover_pos != prev_hover:
+            self.update_guide(prev_hover, self.hover_pos)
+
+    def find_insert_blockers(self):
+        """Nearest cycles left/right of the edited block holding another defined value
+           (not 'X' and not the block's own value) in the drag's initial state, or None."""
+        initial = self.edit_initial_values
+        left_blocker = right_blocker = None
+        # Walk whole runs of equal values (grouped in C by groupby) instead of single cycles
+        
+        # 1. Left Bound search (Scan left from orig_start - 1)
+        t = min(self.edit_orig_start, len(initial)) # First cycle right of the current run
+        for val, grp in groupby(reversed(initial[:t])):
+            if val != 'X' and val != self.edit_value:
+                left_blocker = t - 1
+                break
+            t -= len(list(grp))
+        
+        # 2. Right Bound search (Scan right from orig_end + 1; past the end everything is 'X')
+        t = self.edit_orig_end + 1 # First cycle of the current run
+        for val, grp in groupby(initial[t:]):
+            if val != 'X' and val != self.edit_value:
+                right_blocker = t
+                break
+            t += len(list(grp))
+        
+        return left_blocker, right_blocker
+
+    def update_duration_edit(self, prev_hover, start, end):
+        """Invalidates only what a duration-edit step can change instead of the whole canvas:
+           the edited row(s), the cycle span between the previous and new block edges
+           (up through the header) and the old/new hover guide."""
+        last_span = self.edit_last_span
+        self.edit_last_span = (start, end)
+        if last_span is None:
+            # First step (selection may have jumped): repaint everything once
+            self.update()
+            return
+        
+        cw = self.project.cycle_width
+        width = self.width()
+        v_scroll = self.get_v_scroll()
+        _, visual_layout = self.get_signal_layout(v_scroll)
+        
+        # Edited row, plus its sticky overlay copy if any (block shape/text may shift anywhere in the row)
+        row_ys = [vy for idx, vy, _ in visual_layout if idx == self.edit_signal_index]
+        for vy in row_ys:
+            self.update(QRect(0, vy - 2, width, self.row_height + 4))
+        
+        # Changed cycles: header highlight and the selection's dotted lines above the row
+        lo = min(start, last_span[0])
+        hi = max(end, last_span[1])
+        x1 = self.signal_header_width + lo * cw
+        x2 = self.signal_header_width + (hi + 1) * cw
+        bottom = max(row_ys) + self.row_height + 2 if row_ys else self.height()
+        bottom = max(bottom, v_scroll + self.header_height + 2) # Header highlight even if the row is scrolled away
+        top = min([v_scroll] + [vy - 2 for vy in row_ys])
+        self.update(QRect(x1 - 3, top, x2 - x1 + 6, bottom - top))
+        
+        # Hover guide at its old and new position
+        self.update_guide(prev_hover, self.hover_pos)
+
+    def update_guide(self, *hovers):
+        """Invalidates the hover guide (full-height column, full-width row incl. sticky copies)
+           drawn for each given hover position."""
+        cw = self.project.cycle_width
+        width = self.width()
+        v_scroll = self.get_v_scroll()
+        _, visual_layout = self.get_signal_layout(v_scroll)
+        for hover in set(hovers):
+            if hover is None:
+                continue
+            h_sig, h_cycle = hover
+            self.update(QRect(self.signal_header_width + h_cycle * cw, v_scroll, cw, self.height() - v_scroll))
+            for idx, vy, _ in visual_layout:
+                if idx == h_sig:
+                    self.update(QRect(0, vy - 1, width, self.row_height + 2))
 
     def process_auto_scroll(self):
         if self.auto_scroll_direction == 0:
@@ -1124,7 +1513,7 @@ class WaveformCanvas(QWidget):
                 sb.setValue(sb.value() + step)
                 
                 # Synthesize Mouse Event to update drag state
-                if hasattr(self, 'last_global_pos') and self.last_global_pos:
+                if self.last_global_pos:
                      local_pos = self.mapFromGlobal(self.last_global_pos)
                      
                      # Construct event
@@ -1137,7 +1526,7 @@ class WaveformCanvas(QWidget):
                          Qt.MouseButton.LeftButton,
                          Qt.KeyboardModifier.NoModifier
                      )
-                     self.mouseMoveEvent(event)
+                     self._apply_mouse_move(event)
 
     def start_moving_block(self):
         """Initiates the block moving mode."""
@@ -1165,19 +1554,17 @@ class WaveformCanvas(QWidget):
         
         # Use fuzzy containment check (ONLY if not in immediate multi-move mode)
         # If immediate move is allowed, we trust the multi-selection from mousePress
-        if not getattr(self, 'allow_immediate_move', False):
+        if not self.allow_immediate_move:
             if not self.is_part_of_selection(clicked_region):
                  self.selected_regions = [clicked_region]
             
-        # Initialize Snapshots
-        self.moving_blocks_snapshot = {}
-        for r_sig, r_start, r_end in self.selected_regions:
-            r_signal = self.project.signals[r_sig]
-            if r_sig not in self.moving_blocks_snapshot:
-                self.moving_blocks_snapshot[r_sig] = list(r_signal.values)
-            vals = [r_signal.get_value_at(t) for t in range(r_start, r_end+1)]
-            key = f"{r_sig}_{r_start}_{r_end}"
-            self.moving_blocks_snapshot[key] = vals
+        # Initialize Snapshots: references, not copies. build_move_plan() below reads them before
+        # the drag touches any values and keeps only its own copies (base list, block slices)
+        signals = self.project.signals
+        self.moving_blocks_snapshot = {r_sig: signals[r_sig].values for r_sig, _, _ in self.selected_regions}
+
+        self.build_move_plan()
+        self.move_last_delta = None
 
         # Initialize Preview
         self.preview_selection_regions = []
@@ -1194,6 +1581,56 @@ class WaveformCanvas(QWidget):
         self.setCursor(Qt.CursorShape.SizeAllCursor) # Visual feedback
         self.update()
 
+    def build_move_plan(self):
+        """Precomputes, per moved signal, the snapshot with all selected blocks removed and the
+           blocks' values, so each mouse move only re-inserts them at the current offset."""
+        # Group moves by signal index
+        signals_to_update = {}
+        # Sort selection first to handle multi-select cleanly
+        sorted_sel = sorted(self.selected_regions, key=lambda r: (r[0], r[1]))
+        
+        for region in sorted_sel:
+            s_idx = region[0]
+            if s_idx not in signals_to_update:
+                signals_to_update[s_idx] = []
+            signals_to_update[s_idx].append(region)
+        
+        self.move_plan = {}
+        for s_idx, regions in signals_to_update.items():
+            if s_idx not in self.moving_blocks_snapshot:
+                continue # Should have snapshot
+            
+            # Base content (Original signal state)
+            orig_full_values = self.moving_blocks_snapshot[s_idx]
+            base = orig_full_values[:]
+            
+            # 1. DELETE STEP (Remove all moving blocks from the timeline)
+            # Sort regions Descending to avoid index shift issues during delete
+            regions_desc = sorted(regions, key=lambda r: r[1], reverse=True)
+            
+            for _, start, end in regions_desc:
+                # Remove [start, end]
+                if start < len(base):
+                    # Handle end bound
+                    safe_end = min(end, len(base) - 1)
+                    if safe_end >= start:
+                        del base[start : safe_end + 1]
+            
+            # Extract the block values from original snapshot (in insertion order)
+            blocks = []
+            regions_asc = sorted(regions, key=lambda r: r[1])
+            
+            for _, start, end in regions_asc:
+                block_vals = []
+                if start < len(orig_full_values):
+                    safe_end = min(end, len(orig_full_values) - 1)
+                    block_vals = orig_full_values[start : safe_end + 1]
+                else:
+                    block_vals = ['X'] * (end - start + 1)
+                blocks.append((start, block_vals))
+            
+            self.move_plan[s_idx] = (base, blocks)
+
     def on_long_press(self):
         # Activated after Timer
         self.start_moving_block()
@@ -1206,6 +1643,12 @@ class WaveformCanvas(QWidget):
 
     def mousePressEvent(self, event):
         self.setFocus() # Ensure we get keyboard events (e.g. keyPress)
+        # Apply any deferred move first: the press logic below reads hover_pos (signal/cycle)
+        # from the last applied move, which would otherwise be up to one throttle window old
+        if self._pending_move is not None:
+            pending = self._pending_move
+            self._pending_move = None
+            self._apply_mouse_move(pending)
         
         x = event.pos().x()
         y = event.pos().y()
@@ -1259,6 +1702,7 @@ class WaveformCanvas(QWidget):
                       self.paint_start_pos = event.pos()
                       self.paint_val = '1' if event.button() == Qt.MouseButton.LeftButton else '0'
                       self.is_painting = False # Wait for drag
+                      self.paint_changed = False
                       return
         
         if event.button() == Qt.MouseButton.LeftButton:
@@ -1356,13 +1800,9 @@ class WaveformCanvas(QWidget):
                         elif len(self.selected_regions) == 1:
                              r_sig, r_start, r_end = self.selected_regions[0]
                              if 0 <= r_sig < len(self.project.signals):
-                                 sig = self.project.signals[r_sig]
-                                 # Scan for value change within range
-                                 first_val = sig.get_value_at(r_start)
-                                 for t in range(r_start + 1, r_end + 1):
-                                     if sig.get_value_at(t) != first_val:
-                                         is_multi_block = True
-                                         break
+                                 # Scan for value change within range (one slice, counted in C)
+                                 window = value_window(self.project.signals[r_sig].values, r_start, r_end)
+                                 is_multi_block = bool(window) and window.count(window[0]) != len(window)
                         
                         can_move_immediately = is_multi_block and self.is_part_of_selection(clicked_region)
                         self.allow_immediate_move = can_move_immediately
@@ -1426,6 +1866,9 @@ class WaveformCanvas(QWidget):
                                 self.edit_orig_start = o_start
                                 self.edit_orig_end = o_end
                                 self.edit_initial_values = list(signal.values)
+                                self.edit_written_span = None
+                                self.edit_last_span = None
+                                self.edit_insert_blockers = None
                                 
                                 self.edit_mode = determined_mode
                             else:
@@ -1464,6 +1907,9 @@ class WaveformCanvas(QWidget):
                          self.update()
                             
     def mouseReleaseEvent(self, event):
+        # Apply the last deferred drag position before finishing the drag
+        self._flush_pending_move()
+        self._move_timer.stop()
         self.reorder_candidate_idx = None
         self.scroll_timer.stop()
         self.auto_scroll_direction = 0
@@ -1480,14 +1926,14 @@ class WaveformCanvas(QWidget):
             self.update()
 
         # Handle deferred selection reset (Click without Drag)
-        if hasattr(self, 'pending_selection_reset') and self.pending_selection_reset:
+        if self.pending_selection_reset:
              # Reset ONLY if we did NOT move a block AND did NOT drag duration
-             was_duration_dragged = getattr(self, 'is_duration_dragged', False)
+             was_duration_dragged = self.is_duration_dragged
              
              if not self.is_moving_block and not was_duration_dragged:
                  # It was just a click, reset selection to the single item
                  # Ensure we have the region stored
-                 if hasattr(self, 'pending_click_region') and self.pending_click_region:
+                 if self.pending_click_region:
                      self.selected_regions = [self.pending_click_region]
                      self.bus_selected.emit(self.pending_click_region[0], self.pending_click_region[1])
                      self.update()
@@ -1516,13 +1962,13 @@ class WaveformCanvas(QWidget):
                 
                 # Use the decoupled visual preview regions for the final selection if available
                 # This ensures the selection highlight lands exactly where the user saw it
-                if hasattr(self, 'preview_selection_regions') and self.preview_selection_regions:
+                if self.preview_selection_regions:
                      for (sig_idx, start, end) in self.preview_selection_regions:
                          # Snap float preview back to integer for final commit
                          new_selection.append((sig_idx, int(round(start)), int(round(end))))
                 
                 # Check if we have pre-calculated map from move logic (Fallback)
-                elif hasattr(self, 'move_new_regions_map') and self.move_new_regions_map:
+                elif self.move_new_regions_map:
                      for s_idx, new_regions_list in self.move_new_regions_map.items():
                          if s_idx in self.preview_signal_values: # Only if signal was updated
                              new_selection.extend(new_regions_list)
@@ -1548,10 +1994,9 @@ class WaveformCanvas(QWidget):
             self.is_moving_block = False
             self.move_block_info = None
             self.preview_signal_values = {}
-            if hasattr(self, 'move_new_regions_map'):
-                self.move_new_regions_map = {}
-            if hasattr(self, 'preview_selection_regions'):
-                self.preview_selection_regions = []
+            self.move_plan = {}
+            self.move_new_regions_map = {}
+            self.preview_selection_regions = []
             self.update()
             return
 
@@ -1574,18 +2019,26 @@ class WaveformCanvas(QWidget):
                          # Toggle
                          new_val = '0' if curr == '1' else '1'
                          signal.set_value_at(cycle_idx, new_val)
+                         self.value_toggled.emit(sig_idx, cycle_idx, curr, new_val)
                          self.data_changed.emit()
+            elif self.paint_changed:
+                self.data_changed.emit()
             
             # Reset
             self.paint_start_pos = None
             self.is_painting = False
             self.paint_val = None
+            self.paint_changed = False
             self.update()
             return
 
         if self.is_editing_duration:
+            if self.is_duration_dragged:
+                self.data_changed.emit()
+                self.update()
             self.is_editing_duration = False
             self.is_duration_dragged = False
+            self.edit_last_span = None
             self.edit_signal_index = None
             self.edit_value = None
             self.edit_mode = None
@@ -1598,6 +2051,7 @@ class WaveformCanvas(QWidget):
              # Reorder signals
              if drop_idx != self.dragging_signal_index and drop_idx <= len(self.project.signals):
                  # Move item
+                 self.before_reorder.emit()
                  item = self.project.signals.pop(self.dragging_signal_index)
                  if drop_idx > self.dragging_signal_index:
                      drop_idx -= 1
@@ -1655,10 +2109,8 @@ class WaveformCanvas(QWidget):
             if 0 <= sig_idx < len(self.project.signals):
                 signal = self.project.signals[sig_idx]
                 
-                # Extract Data
-                values = []
-                for t in range(start, end + 1):
-                    values.append(signal.get_value_at(t))
+                # Extract Data (one slice, 'X' past the end)
+                values = value_window(signal.values, start, end)
                     
                 data.append({
                     'rel_sig': sig_idx - min_sig_idx,
@@ -1727,12 +2179,11 @@ class WaveformCanvas(QWidget):
             span_len = max_offset_end - min_offset
             insert_buffer = ['X'] * span_len
             
-            # Fill Buffer
+            # Fill Buffer (one slice store per copied block)
             for item in items:
                 v = item.get('values', [])
                 off = item.get('start_offset', 0) - min_offset
-                for i, val in enumerate(v):
-                    insert_buffer[off + i] = val
+                insert_buffer[off:off + len(v)] = v
             
             # 2. Insert into Signal
             insert_pos = anchor_cycle + min_offset
@@ -1790,23 +2241,12 @@ class WaveformCanvas(QWidget):
              
         # Resolve New Selection
         signal = self.project.signals[new_sig_idx]
-        val = signal.get_value_at(new_cycle)
-        
         o_start = new_cycle
         o_end = new_cycle
         
-        if signal.type in [SignalType.BUS_DATA, SignalType.BUS_STATE] and val != 'X':
+        if signal.type in [SignalType.BUS_DATA, SignalType.BUS_STATE]:
              # Expand block (BUS Logic)
-             for t in range(new_cycle, -1, -1):
-                if signal.get_value_at(t) == val:
-                    o_start = t
-                else:
-                    break
-             for t in range(new_cycle, self.project.total_cycles):
-                if signal.get_value_at(t) == val:
-                    o_end = t
-                else:
-                    break
+             o_start, o_end, _ = self.get_block_bounds(signal, new_cycle)
                     
         self.selected_region = (new_sig_idx, o_start, o_end)
         self.bus_selected.emit(new_sig_idx, new_cycle)
@@ -236,19 +236,11 @@ class BusEditorPanel(QFrame):
         start = cycle_idx
         end = cycle_idx
         
-        # Scan backward
-        for t in range(cycle_idx, -1, -1):
-            if signal.get_value_at(t) == val:
-                start = t
-            else:
-                break
-        
-        # Scan forward
-        for t in range(cycle_idx, total_cycles):
-            if signal.get_value_at(t) == val:
-                end = t
-            else:
-                break
+        # Run containing the cycle (cached run starts, no per-cycle scan); the block
+        # only extends forward up to the last cycle of the project
+        if val != 'X':
+            start, run_end = signal.get_run_bounds(cycle_idx)
+            end = max(cycle_idx, min(run_end, total_cycles - 1))
         
         # Heuristic: 
         # 1. If value is 'X' (Unknown/Default), default to single cycle selection 
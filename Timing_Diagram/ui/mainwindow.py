@@ -368,6 +368,9 @@ class MainWindow(QMainWindow):
         self.canvas = WaveformCanvas(self.project)
         self.canvas.data_changed.connect(self.canvas.update)
         self.canvas.data_changed.connect(lambda: self.set_dirty(True))
+        # Single-cell toggles are recorded as small diff records (no full snapshot)
+        self.canvas.value_toggled.connect(self.undo_manager.push_value_change)
+        self.canvas.before_reorder.connect(self.undo_manager.push_snapshot)
         # Also refresh list if structure changed (reordering in canvas)
         self.canvas.structure_changed.connect(self.refresh_list)
         
@@ -435,8 +438,7 @@ class MainWindow(QMainWindow):
                          if 0 <= sig_idx < len(self.project.signals):
                              sig = self.project.signals[sig_idx]
                              if sig.type in [SignalType.BUS_DATA, SignalType.BUS_STATE]:
-                                 for t in range(start, end + 1):
-                                     sig.set_value_at(t, 'X')
+                                 sig.set_range(start, end, 'X')
                      
                      self.canvas.data_changed.emit()
                      self.canvas.update()
@@ -587,15 +589,14 @@ class MainWindow(QMainWindow):
                          self.cycles_spin.blockSignals(False)
                  
              else: # Overwrite Mode (Default)
-                 for t in range(start, end + 1):
-                    # Auto-expand if writing beyond current length
-                    if t >= self.project.total_cycles:
-                        self.project.total_cycles = t + 1
-                        self.cycles_spin.blockSignals(True)
-                        self.cycles_spin.setValue(self.project.total_cycles)
-                        self.cycles_spin.blockSignals(False)
-                        
-                    signal.set_value_at(t, model_val)
+                 # Auto-expand if writing beyond current length
+                 if start <= end and end >= self.project.total_cycles:
+                     self.project.total_cycles = end + 1
+                     self.cycles_spin.blockSignals(True)
+                     self.cycles_spin.setValue(self.project.total_cycles)
+                     self.cycles_spin.blockSignals(False)
+                 
+                 signal.set_range(start, end, model_val)
                  
                  # Handling "Shortening" of the original block:
                  # If we are editing an existing block and we shorten it, the remaining part 
@@ -607,15 +608,11 @@ class MainWindow(QMainWindow):
                      
                      # Clear Head (if new start is after original start)
                      if start > orig_start:
-                         for t in range(orig_start, start):
-                             if t < self.project.total_cycles:
-                                 signal.set_value_at(t, 'X')
+                         signal.set_range(orig_start, min(start, self.project.total_cycles) - 1, 'X')
                                  
                      # Clear Tail (if new end is before original end)
                      if end < orig_end:
-                         for t in range(end + 1, orig_end + 1):
-                             if t < self.project.total_cycles:
-                                 signal.set_value_at(t, 'X')
+                         signal.set_range(end + 1, min(orig_end, self.project.total_cycles - 1), 'X')
              
              if color:
                  signal.value_colors[model_val] = color
@@ -794,6 +791,8 @@ class MainWindow(QMainWindow):
             if signal:
                 new_signals.append(signal)
         
+        # Snapshot the old order first (undo restores it; diff records rely on it)
+        self.undo_manager.push_snapshot()
         self.project.signals = new_signals
         self.safe_canvas_update()
         self.set_dirty(True)